@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Os módulos do infofetch se importam pelo nome, a partir do diretório deles
+INFOFETCH_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'infofetch')
+sys.path.insert(0, INFOFETCH_DIR)
+
+import command  # noqa: E402
+import infofetch  # noqa: E402
+import osinfo  # noqa: E402
+import oslogos  # noqa: E402
+import profiler  # noqa: E402
+
+# Sistemas de exemplo, montados com dados reais resumidos (arquivos de '/proc' e '/sys' no formato
+# do kernel, pacotes de um 'status' do dpkg, um trecho do 'pci.ids'): 'fixtures/<sistema>/root' é
+# a raiz, 'environ.json' as variáveis da sessão e 'bin' os programas falsos daquele sistema.
+# 'fixtures/bin' tem os programas comuns.
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Máximo de programas executados e de arquivos lidos por uma execução padrão em cada sistema de exemplo
+BUDGETS_PATH = os.path.join(FIXTURES_DIR, 'budgets.json')
+
+
+class Fixture(object):
+    """Create an object of type 'Fixture'
+
+    A sample system, used to get the same information on any machine.
+    """
+    def __init__(self, name: str, fixtures_dir: str = FIXTURES_DIR):
+        """Class constructor
+
+        :param name: Name of the sample system, like 'debian'
+        :param fixtures_dir: Directory with the sample systems
+        """
+        self.name = name
+        self.__fixtures_dir = fixtures_dir
+        self.__path = os.path.join(fixtures_dir, name)
+        with open(os.path.join(self.__path, 'environ.json'), 'r', encoding='utf-8') as environ_file:
+            self.__environ = json.load(environ_file)
+
+    @staticmethod
+    def get_list_of_fixtures(fixtures_dir: str = FIXTURES_DIR) -> list:
+        """Get a list of the sample systems
+
+        :param fixtures_dir: Directory with the sample systems
+        :return: List with the names of the sample systems
+        """
+        return sorted(
+            name for name in os.listdir(fixtures_dir) if os.path.isdir(os.path.join(fixtures_dir, name, 'root')))
+
+    def get_root(self) -> str:
+        """Root directory of the sample system
+
+        :return: String containing the path of the directory used as '/'
+        """
+        return os.path.join(self.__path, 'root')
+
+    def get_os_info(self, profiler: profiler.Profiler = None) -> osinfo.OsInfo:
+        """A new 'OsInfo' for the sample system
+
+        Only the fake programs of the sample system can be executed.
+
+        :param profiler: Records what each fact spent, or None to record nothing
+        :return: 'OsInfo' without cache and without any fact obtained yet
+        """
+        path = os.pathsep.join([os.path.join(self.__path, 'bin'), os.path.join(self.__fixtures_dir, 'bin')])
+        return osinfo.OsInfo(
+            root=self.get_root(), runner=command.CommandRunner(path=path, profiler=profiler),
+            environ=dict(self.__environ), profiler=profiler)
+
+
+class Benchmark(object):
+    """Create an object of type 'Benchmark'
+
+    Measures the time of every 'OsInfo' getter on the sample systems, of drawing every logo
+    and of putting the logo and the information side by side. The results are saved as JSON
+    to compare two versions of the code.
+
+    The sample systems only have an excerpt of 'pci.ids'. When this machine has the whole
+    file, the video cards of each sample system are also looked up in it.
+    """
+    def __init__(self, fixtures: list = None, repeat: int = 20):
+        """Class constructor
+
+        :param fixtures: Names of the sample systems. The default is all of them
+        :param repeat: Number of measurements of each benchmark
+        """
+        self.__fixtures = [Fixture(name) for name in (fixtures if fixtures else Fixture.get_list_of_fixtures())]
+        self.__repeat = repeat
+
+    def __measure(self, prepare) -> dict:
+        # 'prepare' cria, fora da medição, a função a ser medida
+        times = list()
+        for _ in range(self.__repeat):
+            function = prepare()
+            start = time.perf_counter()
+            function()
+            times.append((time.perf_counter() - start) * 1000000)
+
+        return {
+            'min': round(min(times), 1),
+            'median': round(statistics.median(times), 1),
+            'mean': round(statistics.mean(times), 1)}
+
+    @staticmethod
+    def __getters() -> list:
+        return sorted(name for name in dir(osinfo.OsInfo) if name.startswith('get_') and name != 'get_root')
+
+    def __bench_os_info(self, results: dict) -> None:
+        # Cada medição usa um 'OsInfo' novo, então nada vem da memória da sessão
+        for fixture in self.__fixtures:
+            for getter in self.__getters():
+                results['osinfo/{}/{}'.format(fixture.name, getter)] = self.__measure(
+                    lambda: getattr(fixture.get_os_info(), getter))
+
+    def __bench_logos(self, results: dict) -> None:
+        def prepare(logo_id: str):
+            # Esquecer a logo já renderizada para medir a leitura e a renderização
+            oslogos.Logo.clear_rendered_logos()
+            return oslogos.Logo(os_name_id=logo_id).get_colored_ansi_code
+
+        for logo_id in oslogos.Logo.get_list_of_supported_logos():
+            results['logo/{}'.format(logo_id)] = self.__measure(lambda: prepare(logo_id))
+
+    def __bench_render(self, results: dict) -> None:
+        illusion_float = getattr(infofetch.InfoFetch, '_InfoFetch__illusion_float')
+        for fixture in self.__fixtures:
+            fetch = infofetch.InfoFetch(os_info=fixture.get_os_info())
+            results['render/illusion-float/{}'.format(fixture.name)] = self.__measure(
+                lambda: lambda: illusion_float(fetch.logo_as_list, fetch.info_list, 40))
+
+    def __bench_pci_ids(self, results: dict) -> None:
+        pci_ids = next((path for path in osinfo.PCI_IDS_PATHS if os.path.isfile(path)), '')
+        if not pci_ids:
+            return
+
+        for fixture in self.__fixtures:
+            # Raiz com os dispositivos PCI do sistema de exemplo e o 'pci.ids' desta máquina
+            with tempfile.TemporaryDirectory() as root:
+                shutil.copytree(
+                    os.path.join(fixture.get_root(), 'sys', 'bus', 'pci', 'devices'),
+                    os.path.join(root, 'sys', 'bus', 'pci', 'devices'))
+                os.makedirs(os.path.join(root, 'usr', 'share', 'hwdata'))
+                shutil.copyfile(pci_ids, os.path.join(root, 'usr', 'share', 'hwdata', 'pci.ids'))
+                results['pci-ids/{}/get_gpus'.format(fixture.name)] = self.__measure(
+                    lambda: osinfo.OsInfo(root=root).get_gpus)
+
+    def run(self) -> dict:
+        """Runs all the benchmarks
+
+        :return: Dict with the environment and, in 'results', the name of each benchmark
+            with its 'min', 'median' and 'mean' times in microseconds
+        """
+        git = command.CommandRunner().run(
+            ['git', '-C', os.path.dirname(os.path.abspath(__file__)), 'rev-parse', '--short', 'HEAD'])
+        results = dict()
+        self.__bench_os_info(results)
+        self.__bench_logos(results)
+        self.__bench_render(results)
+        self.__bench_pci_ids(results)
+        return {
+            'commit': git.stdout.strip() if git.ok() else None,
+            'python': platform.python_version(),
+            'repeat': self.__repeat,
+            'results': results}
+
+    @staticmethod
+    def compare(old: dict, new: dict, threshold: float = 1.25, min_difference: float = 10.0) -> list:
+        """Finds the benchmarks that became slower
+
+        The medians are compared. Very small differences are ignored, since they are just noise.
+
+        :param old: Result of 'run' used as reference
+        :param new: Result of 'run' to be checked
+        :param threshold: How many times slower a benchmark can become
+        :param min_difference: Smallest difference, in microseconds, that counts
+        :return: List of tuples (name, old median, new median), sorted by name
+        """
+        regressions = list()
+        for name, new_times in sorted(new['results'].items()):
+            old_times = old['results'].get(name)
+            if not old_times:
+                continue
+            old_median, new_median = old_times['median'], new_times['median']
+            if new_median > old_median * threshold and new_median - old_median >= min_difference:
+                regressions.append((name, old_median, new_median))
+
+        return regressions
+
+
+class Guard(object):
+    """Create an object of type 'Guard'
+
+    Checks that a default 'InfoFetch' run on each sample system does not execute more
+    programs or read more files than its declared budget.
+    """
+    def __init__(self, fixtures: list = None, budgets_path: str = BUDGETS_PATH):
+        """Class constructor
+
+        :param fixtures: Names of the sample systems. The default is all of them
+        :param budgets_path: JSON file with the budget of each sample system, like
+            {"debian": {"processes": 3, "files": 10}}
+        """
+        self.__fixtures = [Fixture(name) for name in (fixtures if fixtures else Fixture.get_list_of_fixtures())]
+        with open(budgets_path, 'r', encoding='utf-8') as budgets_file:
+            self.__budgets = json.load(budgets_file)
+
+    @staticmethod
+    def count(fixture: Fixture) -> dict:
+        """Counts what a default run spends on a sample system
+
+        :param fixture: The sample system
+        :return: Dict with the number of 'processes' executed and 'files' read
+        """
+        run_profiler = profiler.Profiler()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fetch = infofetch.InfoFetch(os_info=fixture.get_os_info(run_profiler), profiler=run_profiler)
+            fetch.main()
+        return {'processes': run_profiler.get_phase('processes'), 'files': run_profiler.get_phase('files')}
+
+    def check(self) -> list:
+        """Runs on every sample system and compares with the budgets
+
+        Recorded systems without a budget fail.
+
+        :return: List of tuples (fixture, resource, used, budget, ok), one per resource
+        """
+        checks = list()
+        for fixture in self.__fixtures:
+            budget = self.__budgets.get(fixture.name, dict())
+            for resource, used in sorted(self.count(fixture).items()):
+                limit = budget.get(resource)
+                checks.append((fixture.name, resource, used, limit, limit is not None and used <= limit))
+
+        return checks
+
+
+class Args(object):
+    """Create an object of type 'Args'"""
+    def __init__(self):
+        """Class constructor
+
+        Handles and executes the arguments that have been passed.
+        """
+        self.__repeat = 20
+        self.__fixtures = None
+        self.__output = None
+        self.__compare = None
+        self.__threshold = 1.25
+        self.__guard = False
+        self.__exec_args()
+
+    def __exec_args(self) -> None:
+        args = list(sys.argv)
+        while args:
+            arg = args.pop(0)
+            if arg == '--help':
+                print(
+                    'Use:\n'
+                    '  benchmark.py [options]\n\n'
+                    'OPTIONS                 DESCRIPTION\n'
+                    '--repeat N              -Measurements of each benchmark (20)\n'
+                    '--fixtures NAME,...     -Recorded systems to use: ' + ', '.join(Fixture.get_list_of_fixtures()) + '\n'
+                    '--output FILE           -Saves the results as JSON in FILE instead of...\n'
+                    '                         displaying them\n'
+                    '--compare FILE          -Compares with the results saved in FILE and...\n'
+                    '                         fails if some benchmark became slower\n'
+                    '--threshold RATIO       -How many times slower a benchmark can become (1.25)\n'
+                    '--guard                 -Fails if a run executes more programs or reads...\n'
+                    '                         more files than the budget in ' + BUDGETS_PATH)
+                return
+            try:
+                if arg == '--repeat' or arg.startswith('--repeat='):
+                    self.__repeat = max(int(infofetch.Args.get_value(arg, args)), 1)
+                elif arg == '--fixtures' or arg.startswith('--fixtures='):
+                    self.__fixtures = [name.strip() for name in infofetch.Args.get_value(arg, args).split(',') if name.strip()]
+                elif arg == '--output' or arg.startswith('--output='):
+                    self.__output = infofetch.Args.get_value(arg, args)
+                elif arg == '--compare' or arg.startswith('--compare='):
+                    self.__compare = infofetch.Args.get_value(arg, args)
+                elif arg == '--threshold' or arg.startswith('--threshold='):
+                    self.__threshold = float(infofetch.Args.get_value(arg, args))
+                elif arg == '--guard':
+                    self.__guard = True
+                else:
+                    print('Unknown option: {}'.format(arg), file=sys.stderr)
+                    sys.exit(1)
+            except ValueError:
+                print('Invalid value: {}'.format(arg), file=sys.stderr)
+                sys.exit(1)
+
+        self.__run()
+
+    def __run(self) -> None:
+        unknown_fixtures = [name for name in self.__fixtures or [] if name not in Fixture.get_list_of_fixtures()]
+        if unknown_fixtures:
+            print('Unknown fixture: {}'.format(', '.join(unknown_fixtures)), file=sys.stderr)
+            sys.exit(1)
+
+        if self.__guard:
+            checks = Guard(fixtures=self.__fixtures).check()
+            for fixture, resource, used, limit, ok in checks:
+                print('{:<16} {:<10} {:>4} / {:<4} {}'.format(
+                    fixture, resource, used, limit if limit is not None else '-', 'ok' if ok else 'OVER BUDGET'))
+            if not all(ok for _, _, _, _, ok in checks):
+                sys.exit(1)
+            return
+
+        result = Benchmark(fixtures=self.__fixtures, repeat=self.__repeat).run()
+        if self.__output:
+            with open(self.__output, 'w', encoding='utf-8') as output_file:
+                json.dump(result, output_file, indent=2, sort_keys=True)
+        else:
+            print(json.dumps(result, indent=2, sort_keys=True))
+
+        if self.__compare:
+            with open(self.__compare, 'r', encoding='utf-8') as compare_file:
+                old = json.load(compare_file)
+            regressions = Benchmark.compare(old, result, self.__threshold)
+            for name, old_median, new_median in regressions:
+                print('{}: {:.1f}us -> {:.1f}us ({:.2f}x)'.format(
+                    name, old_median, new_median, new_median / old_median if old_median else 0), file=sys.stderr)
+            if regressions:
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    del(sys.argv[0])
+    args = Args()
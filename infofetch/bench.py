@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import math
+import os
+import sys
+import tempfile
+import time
+
+import factcache
+import infofetch
+import osinfo
+import oslogos
+import profiler
+
+
+class Bench(object):
+    """Create an object of type 'Bench'
+
+    Runs the whole 'InfoFetch' pipeline several times on this system, without displaying it,
+    and measures each phase. Cold runs start from nothing, like the first run after a boot;
+    warm runs reuse a persistent cache filled by a previous run.
+    """
+    def __init__(self, runs: int = 10, fields: list = None):
+        """Class constructor
+
+        :param runs: Number of cold runs and of warm runs
+        :param fields: Names of the fields to collect. The default is all of them
+        """
+        self.__runs = runs
+        self.__fields = fields
+
+    @staticmethod
+    def __percentile(values: list, percent: float) -> float:
+        # Método do posto mais próximo
+        ordered = sorted(values)
+        return ordered[max(int(math.ceil(percent / 100 * len(ordered))) - 1, 0)]
+
+    def __summarize(self, runs: list) -> dict:
+        summary = dict()
+        for name in ['probes', 'render', 'total', 'processes']:
+            values = [run[name] for run in runs]
+            summary[name] = {
+                'p50': self.__percentile(values, 50), 'p95': self.__percentile(values, 95),
+                'p99': self.__percentile(values, 99), 'min': min(values), 'max': max(values)}
+
+        return summary
+
+    def __run(self, cache_path: str = None) -> dict:
+        # Um 'OsInfo' novo por execução, como um novo processo
+        run_profiler = profiler.Profiler()
+        cache = factcache.FactCache(cache_path) if cache_path else None
+        if cache is None:
+            oslogos.Logo.clear_rendered_logos()
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fetch = infofetch.InfoFetch(
+                fields=self.__fields, os_info=osinfo.OsInfo(cache=cache, profiler=run_profiler),
+                profiler=run_profiler)
+            fetch.main()
+        total = time.perf_counter() - start
+
+        return {
+            'probes': round(run_profiler.get_phase('probes') * 1000, 3),
+            'render': round(run_profiler.get_phase('render') * 1000, 3),
+            'total': round(total * 1000, 3),
+            'processes': run_profiler.get_phase('processes')}
+
+    def run(self) -> dict:
+        """Runs the pipeline and summarizes the measurements
+
+        Times are in milliseconds and 'processes' is the number of programs executed per run.
+
+        :return: Dict with the operating system and, for 'cold' and 'warm', the p50, p95, p99,
+            min and max of each phase
+        """
+        cold_runs = [self.__run() for _ in range(self.__runs)]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, 'facts.json')
+            self.__run(cache_path)  # Preenche o cache
+            warm_runs = [self.__run(cache_path) for _ in range(self.__runs)]
+
+        os_info = osinfo.OsInfo()
+        return {
+            'os': os_info.get_name_id(),
+            'kernel': os_info.get_kernel_version(),
+            'python': sys.version.split()[0],
+            'runs': self.__runs,
+            'cold': self.__summarize(cold_runs),
+            'warm': self.__summarize(warm_runs)}
+
+
+if __name__ == '__main__':
+    import json
+    print(json.dumps(Bench(runs=3).run(), indent=2))
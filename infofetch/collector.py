@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import queue
+import sys
+import threading
+import time
+
+
+class _Task(object):
+    # Uma sonda (probe) e o seu estado de execução
+    def __init__(self, name: str, function, timeout: float):
+        self.name = name
+        self.function = function
+        self.timeout = timeout
+        self.started = None
+        self.finished = False
+        self.expired = False
+        self.value = None
+        self.error = None
+
+
+class Collector(object):
+    """Create an object of type 'Collector'
+
+    Runs independent probes at the same time on a bounded pool of threads.
+    """
+    def __init__(self, max_workers: int = 8, timeout: float = 3.0):
+        """Class constructor
+
+        :param max_workers: Maximum number of probes running at the same time
+        :param timeout: Time limit, in seconds, for each probe, counted from when it starts
+        """
+        self.__max_workers = max_workers
+        self.__timeout = timeout
+        self.__condition = threading.Condition()
+        self.__queue = queue.Queue()
+        self.__out_of_budget = list()
+
+    def __worker(self) -> None:
+        # As threads são 'daemon', então uma sonda travada não segura o fim do programa
+        while True:
+            try:
+                task = self.__queue.get_nowait()
+            except queue.Empty:
+                return
+
+            with self.__condition:
+                # Sonda abandonada antes de começar, pelo limite total de tempo
+                if task.expired:
+                    continue
+                task.started = time.monotonic()
+                self.__condition.notify_all()
+
+            try:
+                value = task.function()
+                error = None
+            except Exception as exc:
+                value = None
+                error = exc
+
+            with self.__condition:
+                task.value = value
+                task.error = error
+                task.finished = True
+                self.__condition.notify_all()
+
+            # Uma sonda expirada já teve o seu lugar ocupado por outra thread
+            if task.expired:
+                return
+
+    def __start_worker(self) -> None:
+        thread = threading.Thread(target=self.__worker, daemon=True)
+        thread.start()
+
+    def collect(self, probes: dict, on_result=None, budget: float = None) -> dict:
+        """Runs the probes
+
+        Each probe is a function without arguments. Probes that fail or that do not finish
+        within the time limit are left out of the result; the errors of the probes that
+        fail are written to the standard error.
+
+        :param probes: Dict with the name of the probe as key and the function as value
+        :param on_result: Function called with the name and the value of each probe as soon
+            as it finishes, in the thread that called 'collect'
+        :param budget: Time limit, in seconds, for all the probes together. Probes still
+            running are abandoned and probes that have not started are not run
+        :return: Dict with the name of the probe as key and the returned value as value
+        """
+        deadline = time.monotonic() + budget if budget is not None else None
+        self.__out_of_budget = list()
+        tasks = [_Task(name, function, self.__timeout) for name, function in probes.items()]
+        for task in tasks:
+            self.__queue.put(task)
+
+        for _ in range(min(self.__max_workers, len(tasks))):
+            self.__start_worker()
+
+        reported = list()
+        while True:
+            with self.__condition:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    for task in tasks:
+                        if not task.finished and not task.expired:
+                            task.expired = True
+                            self.__out_of_budget.append(task.name)
+
+                pending = list()
+                for task in tasks:
+                    if task.finished or task.expired:
+                        continue
+                    if task.started is not None and now - task.started >= task.timeout:
+                        # Abandonar a sonda e repor a thread perdida
+                        task.expired = True
+                        if not self.__queue.empty():
+                            self.__start_worker()
+                        continue
+                    pending.append(task)
+
+                ready = [
+                    task for task in tasks
+                    if task.finished and not task.expired and task.error is None and task not in reported]
+                if pending and not ready:
+                    deadlines = [task.started + task.timeout for task in pending if task.started is not None]
+                    if deadline is not None:
+                        deadlines.append(deadline)
+                    self.__condition.wait(min(deadlines) - now if deadlines else None)
+                    continue
+
+            # O aviso é dado fora do lock, para não segurar as outras threads
+            for task in ready:
+                reported.append(task)
+                if on_result is not None:
+                    on_result(task.name, task.value)
+
+            if not pending:
+                break
+
+        result = dict()
+        for task in tasks:
+            if task.finished and not task.expired and task.error is None:
+                result[task.name] = task.value
+            # Uma sonda com erro é um defeito, não informação indisponível: avisar
+            elif task.finished and not task.expired:
+                print('Probe "{}" failed: {}: {}'.format(
+                    task.name, type(task.error).__name__, task.error), file=sys.stderr)
+
+        return result
+
+    def get_out_of_budget(self) -> list:
+        """Probes of the last 'collect' that did not finish within its 'budget'
+
+        Probes that failed or that went over their own time limit are not included.
+
+        :return: List with the names of the probes
+        """
+        return list(self.__out_of_budget)
+
+
+if __name__ == '__main__':
+    def slow():
+        time.sleep(5)
+        return 'slow'
+
+    c = Collector(max_workers=2, timeout=1.0)
+    start = time.monotonic()
+    print(c.collect({'a': lambda: 'a', 'slow': slow, 'b': lambda: 'b'}))
+    print('{:.2f}s'.format(time.monotonic() - start))
+    start = time.monotonic()
+    print(c.collect({'slow': slow, 'other-slow': slow, 'a': lambda: 'a'}, budget=0.2))
+    print(c.get_out_of_budget())
+    print('{:.2f}s'.format(time.monotonic() - start))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+import contextlib
+import os
+import re
+import shutil
+import subprocess
+import threading
+
+import factcache
+import profiler
+
+
+class CommandResult(object):
+    """Create an object of type 'CommandResult'
+
+    The result of a command executed by 'CommandRunner'.
+    """
+    def __init__(self, argv: list, found: bool, returncode: int = None, stdout: str = '', timed_out: bool = False):
+        """Class constructor
+
+        :param argv: The command and its arguments
+        :param found: False if the program does not exist or cannot be executed
+        :param returncode: Exit status of the program, or None if it was not executed until the end
+        :param stdout: Standard output of the program
+        :param timed_out: True if the program was stopped for exceeding the time limit
+        """
+        self.argv = argv
+        self.found = found
+        self.returncode = returncode
+        self.stdout = stdout
+        self.timed_out = timed_out
+
+    def ok(self) -> bool:
+        """Checks if the program ran until the end without errors
+
+        :return: True if the program was found, finished in time and returned 0
+        """
+        return self.found and not self.timed_out and self.returncode == 0
+
+    def lines(self) -> list:
+        """Non-empty lines of the output
+
+        Like 'grep -v ^$'.
+
+        :return: List of lines
+        """
+        return [line for line in self.stdout.split('\n') if line.strip()]
+
+    def grep(self, pattern: str, ignore_case: bool = False) -> list:
+        """Lines of the output that match a regular expression
+
+        Like 'grep' or 'grep -i'.
+
+        :param pattern: Regular expression
+        :param ignore_case: Ignore uppercase and lowercase differences
+        :return: List of lines
+        """
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        return [line for line in self.lines() if regex.search(line)]
+
+    @staticmethod
+    def field(line: str, index: int, separator: str = None) -> str:
+        """A field of a line
+
+        Like "awk '{print $N}'", but 'index' starts at 0.
+
+        :param line: A line of the output
+        :param index: Position of the field
+        :param separator: Field separator; the default is any whitespace
+        :return: String containing the field, or empty if the line does not have it
+        """
+        fields = line.split(separator)
+        return fields[index].strip() if -len(fields) <= index < len(fields) else ''
+
+
+class ToolIndex(object):
+    """Create an object of type 'ToolIndex'
+
+    Knows where each program is, or that it is not installed, without executing anything.
+    The answers can be kept in a persistent cache; they stay valid while '$PATH' and the
+    modification times of its directories do not change.
+    """
+    def __init__(self, path: str = None, cache: factcache.FactCache = None):
+        """Class constructor
+
+        :param path: Directories where the programs are searched, like '$PATH'. The default
+            is the '$PATH' of this process
+        :param cache: Persistent cache for the answers, or None to keep them only in memory
+        """
+        self.__path = path if path is not None else os.environ.get('PATH', os.defpath)
+        self.__cache = cache
+        self.__lock = threading.Lock()
+        self.__key = None
+        self.__tools = None
+
+    def __load(self) -> dict:
+        # Na primeira consulta: a chave de invalidação e as respostas já conhecidas
+        if self.__tools is None:
+            self.__key = ['path', self.__path]
+            for directory in self.__path.split(os.pathsep):
+                try:
+                    self.__key.append(os.stat(directory).st_mtime_ns)
+                except OSError:
+                    self.__key.append(0)
+
+            tools = None
+            if self.__cache is not None:
+                _, tools = self.__cache.get('tools', self.__key)
+            self.__tools = tools if isinstance(tools, dict) else dict()
+
+        return self.__tools
+
+    def find(self, name: str) -> str:
+        """Where a program is
+
+        Like 'command -v'.
+
+        :param name: Name of the program, like 'lspci', or its path
+        :return: String containing the path of the program, or None if it is not installed
+        """
+        with self.__lock:
+            tools = self.__load()
+            if name in tools:
+                return tools[name]
+
+        executable = shutil.which(name, path=self.__path)
+        with self.__lock:
+            self.__tools[name] = executable
+            if self.__cache is not None:
+                self.__cache.set('tools', self.__key, dict(self.__tools))
+
+        return executable
+
+
+class CommandRunner(object):
+    """Create an object of type 'CommandRunner'
+
+    Executes programs directly, with a list of arguments and without a shell. Programs that
+    are not installed are known from a 'ToolIndex', so nothing is started for them.
+    """
+    def __init__(
+            self, timeout: float = 5.0, enabled: bool = True, path: str = None, profiler: profiler.Profiler = None,
+            tools: ToolIndex = None):
+        """Class constructor
+
+        :param timeout: Time limit, in seconds, for each command
+        :param enabled: If False, no program is executed and every command is reported as
+            not found. Used when the information comes from another root directory, where
+            the programs of the running system would give wrong answers
+        :param path: Directories where the programs are searched, like '$PATH'. The default
+            is the '$PATH' of this process
+        :param profiler: Counts and measures the programs executed, or None to record nothing
+        :param tools: Where the programs are. The default is a new index of 'path', kept only in memory
+        """
+        self.__timeout = timeout
+        self.__enabled = enabled
+        self.__path = path
+        self.__profiler = profiler
+        self.__tools = tools if tools is not None else ToolIndex(path=path)
+
+    def run(self, argv: list) -> CommandResult:
+        """Executes a program
+
+        The standard error output is discarded. A missing program does not raise an error,
+        it is reported in the result with 'found' as False.
+
+        :param argv: The command and its arguments, like ['lspci', '-n']
+        :return: The result of the command
+        """
+        if not self.__enabled:
+            return CommandResult(argv, found=False)
+
+        # Programa ausente: nenhum processo é criado
+        executable = self.__tools.find(argv[0])
+        if executable is None:
+            return CommandResult(argv, found=False)
+
+        env = None
+        if self.__path is not None:
+            env = dict(os.environ, PATH=self.__path)
+
+        try:
+            with self.__profiler.process(argv) if self.__profiler is not None else contextlib.nullcontext():
+                completed = subprocess.run(
+                    [executable] + list(argv[1:]), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL, universal_newlines=True, errors='replace', timeout=self.__timeout,
+                    env=env)
+        except (FileNotFoundError, PermissionError, NotADirectoryError):
+            return CommandResult(argv, found=False)
+        except subprocess.TimeoutExpired as error:
+            stdout = error.stdout if isinstance(error.stdout, str) else ''
+            return CommandResult(argv, found=True, stdout=stdout, timed_out=True)
+
+        return CommandResult(argv, found=True, returncode=completed.returncode, stdout=completed.stdout)
+
+
+if __name__ == '__main__':
+    cr = CommandRunner()
+    result = cr.run(['uname', '-a'])
+    print(result.found, result.returncode, result.stdout)
+    result = cr.run(['this-command-does-not-exist'])
+    print(result.found, result.returncode, result.stdout)
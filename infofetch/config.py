@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import os
+
+import filereader
+
+
+class Config(object):
+    """Create an object of type 'Config'
+
+    Reads the user settings from '$XDG_CONFIG_HOME/infofetch/config'.
+    The file uses the 'key = value' format, like:
+
+        fields = title, os, kernel, ram, uptime
+    """
+    def __init__(self, path: str = None):
+        """Class constructor
+
+        :param path: Path of the configuration file. The default is '$XDG_CONFIG_HOME/infofetch/config'
+        """
+        self.__path = path if path else self.default_path()
+        self.__settings = filereader.FileReader().read_key_value(self.__path)
+
+    @staticmethod
+    def default_path() -> str:
+        """Default path of the configuration file
+
+        :return: String containing '$XDG_CONFIG_HOME/infofetch/config'
+        """
+        config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+        return os.path.join(config_home, 'infofetch', 'config')
+
+    def get_fields(self) -> list:
+        """Fields to display
+
+        :return: List with the field names, or None if the setting is not in the file
+        """
+        if 'fields' not in self.__settings:
+            return None
+        return self.split_list(self.__settings['fields'])
+
+    @staticmethod
+    def split_list(value: str) -> list:
+        """Splits a comma-separated list
+
+        :param value: String like 'os, kernel,ram'
+        :return: List like ['os', 'kernel', 'ram']
+        """
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+
+if __name__ == '__main__':
+    c = Config()
+    print(c.default_path())
+    print(c.get_fields())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import os
+
+import collector
+import osinfo
+import report
+
+
+class Containers(object):
+    """Create an object of type 'Containers'
+
+    Finds the running containers and gets the operating system of each one, without running
+    anything inside them. A container is a group of processes with its own mount namespace;
+    its files are read through '/proc/<pid>/root' of one of the processes.
+    """
+    def __init__(self, max_workers: int = 8, timeout: float = 10.0):
+        """Class constructor
+
+        :param max_workers: Maximum number of containers inspected at the same time
+        :param timeout: Time limit, in seconds, to inspect each container
+        """
+        self.__max_workers = max_workers
+        self.__timeout = timeout
+
+    @staticmethod
+    def __mount_namespace(pid: str) -> str:
+        try:
+            return os.readlink('/proc/{}/ns/mnt'.format(pid))
+        except OSError:
+            return ''
+
+    @staticmethod
+    def __root_identity(path: str) -> tuple:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    @staticmethod
+    def __has_command_line(pid: int) -> bool:
+        try:
+            with open('/proc/{}/cmdline'.format(pid), 'rb') as cmdline:
+                return bool(cmdline.read(1))
+        except OSError:
+            return False
+
+    def find(self) -> list:
+        """Finds the running containers
+
+        Processes with their own mount namespace but the same root directory as the system,
+        like services with 'PrivateTmp=', are not containers. Needs permission to read the namespaces of the processes of other users, usually root.
+
+        :return: List of dicts with 'pid' (the first process of the container) and 'mount-namespace'
+        """
+        host_namespace = self.__mount_namespace('self')
+        host_root = self.__root_identity('/')
+        namespaces = dict()
+        try:
+            with os.scandir('/proc') as entries:
+                pids = sorted(int(entry.name) for entry in entries if entry.name.isdigit())
+        except OSError:
+            return []
+
+        for pid in pids:
+            namespace = self.__mount_namespace(pid)
+            # Processos do próprio sistema, de outros usuários ou que já terminaram
+            if not namespace or namespace == host_namespace or namespace in namespaces:
+                continue
+            # Threads do kernel não têm linha de comando
+            if not self.__has_command_line(pid):
+                continue
+            # Serviços com 'PrivateTmp=', 'ProtectSystem=' etc. têm o seu namespace, mas a raiz é a do sistema
+            root = self.__root_identity('/proc/{}/root/'.format(pid))
+            if root is not None and root != host_root:
+                namespaces[namespace] = pid
+
+        return [{'pid': pid, 'mount-namespace': namespace} for namespace, pid in namespaces.items()]
+
+    @staticmethod
+    def __inspect(container: dict) -> dict:
+        os_info = osinfo.OsInfo(root='/proc/{}/root'.format(container['pid']))
+        values = report.Report(fields=['os', 'packages'], os_info=os_info).get_values()
+        return {
+            'pid': container['pid'],
+            'mount-namespace': container['mount-namespace'],
+            'hostname': os_info.get_hostname() or None,
+            'os': values['os'],
+            'packages': values['packages'],
+        }
+
+    def get_values(self) -> list:
+        """Operating system and packages of each running container
+
+        The containers are inspected at the same time. Containers that stop or cannot be
+        read in time are left out.
+
+        :return: List of dicts with 'pid', 'mount-namespace', 'hostname', 'os' and 'packages',
+            like the values of 'report.Report'
+        """
+        containers = self.find()
+        probes = {container['pid']: lambda container=container: self.__inspect(container) for container in containers}
+        values = collector.Collector(max_workers=self.__max_workers, timeout=self.__timeout).collect(probes)
+        return [values[container['pid']] for container in containers if container['pid'] in values]
+
+
+if __name__ == '__main__':
+    for c in Containers().get_values():
+        print(c)
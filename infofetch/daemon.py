@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+# Variáveis da sessão que mudam o que é exibido; um snapshot só vale para a mesma sessão
+SESSION_VARIABLES = ['DISPLAY', 'WAYLAND_DISPLAY', 'XDG_CURRENT_DESKTOP', 'XDG_SESSION_TYPE', 'SHELL']
+
+
+class Daemon(object):
+    """Create an object of type 'Daemon'
+
+    Keeps a snapshot of the system information in memory and sends it to the clients
+    that connect to a UNIX socket. The snapshot is rebuilt in the background from time
+    to time, so the facts that change (memory, uptime) stay current.
+    """
+    def __init__(self, snapshot, socket_path: str = None, interval: float = 5.0):
+        """Class constructor
+
+        :param snapshot: Function without arguments that returns the snapshot as a dict
+        :param socket_path: Path of the socket. The default is the one of 'default_socket_path'
+        :param interval: Seconds between two refreshes of the snapshot
+        """
+        self.__snapshot = snapshot
+        self.__socket_path = socket_path if socket_path else self.default_socket_path()
+        self.__interval = interval
+        self.__data = b''
+
+    @staticmethod
+    def default_socket_path() -> str:
+        """Default path of the socket
+
+        One socket per user, in '$XDG_RUNTIME_DIR' or, without it, in '/tmp'.
+
+        :return: String containing the path of the socket
+        """
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if runtime_dir:
+            return os.path.join(runtime_dir, 'infofetch.sock')
+        return '/tmp/infofetch-{}.sock'.format(os.getuid())
+
+    def __refresh(self) -> None:
+        # A troca da variável é atômica; os clientes sempre recebem um snapshot completo
+        self.__data = json.dumps(self.__snapshot()).encode('utf-8')
+
+    def __refresh_forever(self) -> None:
+        while True:
+            time.sleep(self.__interval)
+            try:
+                self.__refresh()
+            except Exception as error:
+                print(error, file=sys.stderr)
+
+    def __bind(self) -> socket.socket:
+        # Um socket que sobrou de um daemon que não está mais rodando é removido
+        if os.path.exists(self.__socket_path):
+            if Client(self.__socket_path).get_snapshot() is not None:
+                raise OSError('infofetch daemon already running on {}'.format(self.__socket_path))
+            os.unlink(self.__socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)  # Somente o próprio usuário pode conectar
+        try:
+            server.bind(self.__socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen(64)
+        return server
+
+    def serve_forever(self) -> None:
+        """Answers the clients until the process is stopped
+
+        :raises OSError: If another daemon is already using the socket
+        """
+        self.__refresh()
+        server = self.__bind()
+        threading.Thread(target=self.__refresh_forever, daemon=True).start()
+
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    connection.settimeout(1.0)
+                    try:
+                        connection.sendall(self.__data)
+                    except OSError:
+                        pass
+        finally:
+            server.close()
+            os.unlink(self.__socket_path)
+
+
+class Client(object):
+    """Create an object of type 'Client'
+
+    Gets the snapshot of a running 'Daemon'.
+    """
+    def __init__(self, socket_path: str = None, timeout: float = 0.5):
+        """Class constructor
+
+        :param socket_path: Path of the socket. The default is the one of 'Daemon.default_socket_path'
+        :param timeout: Time limit, in seconds, to connect and receive the snapshot
+        """
+        self.__socket_path = socket_path if socket_path else Daemon.default_socket_path()
+        self.__timeout = timeout
+
+    def get_snapshot(self) -> dict:
+        """Gets the snapshot
+
+        Only a daemon of the same user is trusted, since anyone can create a socket in '/tmp'.
+
+        :return: The snapshot as a dict, or None if there is no daemon of this user answering
+        """
+        if not os.path.exists(self.__socket_path):
+            return None
+
+        chunks = list()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.settimeout(self.__timeout)
+                client.connect(self.__socket_path)
+                # Credenciais do processo do outro lado: (pid, uid, gid)
+                _, uid, _ = struct.unpack('3i', client.getsockopt(
+                    socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+                if uid != os.getuid():
+                    return None
+                while True:
+                    chunk = client.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            snapshot = json.loads(b''.join(chunks).decode('utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        return snapshot if isinstance(snapshot, dict) else None
+
+
+if __name__ == '__main__':
+    print(Daemon.default_socket_path())
+    print(Client().get_snapshot())
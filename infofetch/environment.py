@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import os
+
+import filereader
+
+# Campos (de 'InfoFetch' e 'report.Report') que só existem numa sessão gráfica
+GRAPHICAL_FIELDS = ['resolution', 'de', 'wm', 'font', 'browser']
+
+# Campos lidos do DMI, que num contêiner descrevem a máquina hospedeira
+HARDWARE_FIELDS = ['board']
+
+# Marcas deixadas no '/proc/1/cgroup' pelos gerenciadores de contêineres
+CONTAINER_CGROUPS = [('kubepods', 'kubernetes'), ('docker', 'docker'), ('libpod', 'podman'), ('lxc', 'lxc')]
+
+
+class Environment(object):
+    """Create an object of type 'Environment'
+
+    Classifies where infofetch is running: with or without a graphical session, inside a
+    container or not. Only files and environment variables are read.
+    """
+    def __init__(self, files: filereader.FileReader = None, environ: dict = None):
+        """Class constructor
+
+        :param files: Reads the system files. The default reads from the real root
+        :param environ: Environment variables of the session. The default is the one of this process
+        """
+        self.__files = files if files else filereader.FileReader()
+        self.__environ = environ if environ is not None else os.environ
+
+    def is_headless(self) -> bool:
+        """Checks if there is no graphical session
+
+        A session exists if '$WAYLAND_DISPLAY' or '$DISPLAY' point to a display that can be
+        reached; variables inherited by a container or an SSH login without the socket do not count.
+
+        :return: True if there is no graphical session
+        """
+        wayland_display = self.__environ.get('WAYLAND_DISPLAY', '')
+        if wayland_display:
+            runtime_dir = self.__environ.get('XDG_RUNTIME_DIR', '')
+            if os.path.isabs(wayland_display) or not runtime_dir:
+                if self.__files.exists(wayland_display):
+                    return False
+            elif self.__files.exists(os.path.join(runtime_dir, wayland_display)):
+                return False
+
+        display = self.__environ.get('DISPLAY', '')
+        if display:
+            host, _, number = display.rpartition(':')
+            # 'localhost:10.0' (SSH -X) é uma conexão de rede; ':0' é o socket local
+            if host and host != 'unix':
+                return False
+            if self.__files.exists('/tmp/.X11-unix/X' + number.split('.')[0]):
+                return False
+
+        return True
+
+    def get_container(self) -> str:
+        """Container technology
+
+        Like 'systemd-detect-virt --container'.
+
+        :return: String like 'docker', 'podman' or 'lxc', or empty if not in a container
+        """
+        container = self.__files.read('/run/systemd/container').strip()
+        if container:
+            return container
+        if self.__files.exists('/.dockerenv'):
+            return 'docker'
+        if self.__files.exists('/run/.containerenv'):
+            return 'podman'
+
+        for line in self.__files.read_lines('/proc/1/cgroup'):
+            for mark, container in CONTAINER_CGROUPS:
+                if mark in line:
+                    return container
+
+        return ''
+
+    @staticmethod
+    def get_disabled_fields(headless: bool, container: str) -> list:
+        """Fields that are not probed in an environment
+
+        Without a graphical session or inside a container the graphical fields are
+        meaningless; inside a container the hardware fields are the ones of the host.
+
+        :param headless: If there is no graphical session, from 'is_headless'
+        :param container: Container technology, from 'get_container'
+        :return: List with the field names, like the ones of 'InfoFetch'
+        """
+        disabled_fields = list()
+        if headless or container:
+            disabled_fields += GRAPHICAL_FIELDS
+        if container:
+            disabled_fields += HARDWARE_FIELDS
+        return disabled_fields
+
+
+if __name__ == '__main__':
+    e = Environment()
+    print('headless:', e.is_headless())
+    print('container:', e.get_container())
+    print('disabled:', e.get_disabled_fields(e.is_headless(), e.get_container()))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import json
+import os
+import threading
+import time
+
+
+class FactCache(object):
+    """Create an object of type 'FactCache'
+
+    Keeps system facts on disk between runs. Each fact is stored with an invalidation
+    key (boot id, modification time of the source files, ...) and is only reused while
+    the key is the same and, optionally, while it is younger than a time limit.
+    """
+    def __init__(self, path: str = None):
+        """Class constructor
+
+        :param path: Path of the cache file. The default is '$XDG_CACHE_HOME/infofetch/facts.json'
+        """
+        self.__path = path if path else self.default_path()
+        self.__lock = threading.Lock()
+        self.__facts = None
+        self.__changed = False
+
+    @staticmethod
+    def default_path() -> str:
+        """Default path of the cache file
+
+        :return: String containing '$XDG_CACHE_HOME/infofetch/facts.json'
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cache_home, 'infofetch', 'facts.json')
+
+    def __load(self) -> dict:
+        # Carrega o arquivo somente no primeiro acesso
+        if self.__facts is None:
+            try:
+                with open(self.__path, 'r') as cache_file:
+                    facts = json.load(cache_file)
+                self.__facts = facts if isinstance(facts, dict) else dict()
+            except (OSError, ValueError):
+                self.__facts = dict()
+        return self.__facts
+
+    def get(self, name: str, key: list, ttl: float = None) -> tuple:
+        """Gets a fact
+
+        :param name: Name of the fact
+        :param key: Invalidation key; the fact is only valid if it was stored with the same key
+        :param ttl: Maximum age of the fact in seconds, or None for no limit
+        :return: Tuple (found, value); 'found' is False when the fact is missing or stale
+        """
+        with self.__lock:
+            entry = self.__load().get(name)
+
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return False, None
+        if ttl is not None and time.time() - entry.get('time', 0) > ttl:
+            return False, None
+        return True, entry.get('value')
+
+    def set(self, name: str, key: list, value) -> None:
+        """Stores a fact
+
+        The fact is only written to disk by 'save'.
+
+        :param name: Name of the fact
+        :param key: Invalidation key
+        :param value: Value of the fact; must be serializable as JSON
+        """
+        with self.__lock:
+            self.__load()[name] = {'key': key, 'time': time.time(), 'value': value}
+            self.__changed = True
+
+    def save(self) -> None:
+        """Writes the facts to disk
+
+        Nothing is written if no fact has changed. Errors, like a read-only home, are ignored.
+        """
+        with self.__lock:
+            if not self.__changed:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+                temporary_path = '{}.{}.tmp'.format(self.__path, os.getpid())
+                with open(temporary_path, 'w') as cache_file:
+                    json.dump(self.__facts, cache_file)
+                os.replace(temporary_path, self.__path)
+                self.__changed = False
+            except OSError:
+                pass
+
+
+if __name__ == '__main__':
+    fc = FactCache()
+    print(fc.default_path())
+    print(fc.get('cpu', None))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import threading
+
+import profiler
+
+
+class FactStore(object):
+    """Create an object of type 'FactStore'
+
+    Remembers facts computed during a session, including empty ones. When several threads
+    ask for the same fact at the same time, only one computes it and the others wait for
+    its value.
+    """
+    def __init__(self, profiler: profiler.Profiler = None):
+        """Class constructor
+
+        :param profiler: Records the time spent waiting for other threads, or None to record nothing
+        """
+        self.__profiler = profiler
+        self.__lock = threading.Lock()
+        self.__facts = dict()
+        self.__in_flight = dict()
+
+    def get(self, name: str, probe):
+        """Gets a fact, computing it only once
+
+        If 'probe' raises an exception, nothing is remembered and the exception is passed on;
+        the threads that were waiting try again.
+
+        :param name: Name of the fact
+        :param probe: Function without arguments that computes the fact
+        :return: The value of the fact
+        """
+        while True:
+            with self.__lock:
+                if name in self.__facts:
+                    return self.__facts[name]
+
+                event = self.__in_flight.get(name)
+                owner = event is None
+                if owner:
+                    event = threading.Event()
+                    self.__in_flight[name] = event
+
+            if not owner:
+                # Outra thread já está obtendo este fato
+                if self.__profiler is not None:
+                    with self.__profiler.span(name, 'wait'):
+                        event.wait()
+                else:
+                    event.wait()
+                continue
+
+            try:
+                value = probe()
+            except BaseException:
+                with self.__lock:
+                    del self.__in_flight[name]
+                event.set()
+                raise
+
+            with self.__lock:
+                self.__facts[name] = value
+                del self.__in_flight[name]
+            event.set()
+            return value
+
+    def forget(self, *names) -> None:
+        """Forgets facts, so they are computed again on the next request
+
+        :param names: Names of the facts
+        """
+        with self.__lock:
+            for name in names:
+                self.__facts.pop(name, None)
+
+
+if __name__ == '__main__':
+    import time
+
+    def slow_probe():
+        print('probing...')
+        time.sleep(0.5)
+        return ''
+
+    fs = FactStore()
+    threads = [threading.Thread(target=fs.get, args=('gpu', slow_probe)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(repr(fs.get('gpu', slow_probe)))
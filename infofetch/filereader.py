@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+import os
+
+import profiler
+
+
+class FileReader(object):
+    """Create an object of type 'FileReader'
+
+    Reads system files directly, without starting a shell. The paths can be read from under
+    another root directory, like a mounted image or the root of a container.
+    """
+    def __init__(self, root: str = None, profiler: profiler.Profiler = None):
+        """Class constructor
+
+        :param root: Directory used as '/' for all the paths. The default is the real root
+        :param profiler: Counts the files and bytes read, or None to count nothing
+        """
+        root = os.path.abspath(root) if root else '/'
+        self.__root = '' if root == '/' else root
+        self.__profiler = profiler
+
+    def get_root(self) -> str:
+        """The directory used as '/'
+
+        :return: String containing the absolute path of the root directory
+        """
+        return self.__root if self.__root else '/'
+
+    def path(self, path: str) -> str:
+        """The real path of a path under the root
+
+        Symbolic links are followed inside the root, so an absolute link in an image does
+        not point to a file of the running system.
+
+        :param path: Absolute path, as seen from inside the root
+        :return: String containing the path to be opened
+        """
+        if not self.__root:
+            return path
+
+        parts = path.split('/')
+        resolved = list()
+        links = 0
+        while parts:
+            part = parts.pop(0)
+            if part in ('', '.'):
+                continue
+            if part == '..':
+                if resolved:
+                    resolved.pop()
+                continue
+
+            real_path = os.path.join(self.__root, *resolved, part)
+            # Limite de links, como o ELOOP do kernel
+            if links < 40 and os.path.islink(real_path):
+                links += 1
+                try:
+                    target = os.readlink(real_path)
+                except OSError:
+                    target = part
+                if target.startswith('/'):
+                    resolved = list()
+                parts = target.split('/') + parts
+                continue
+            resolved.append(part)
+
+        return os.path.join(self.__root, *resolved)
+
+    def read(self, path: str) -> str:
+        """The content of a file
+
+        Files that do not exist or that cannot be read return an empty string.
+
+        :param path: Absolute path of the file, under the root
+        :return: String containing the content of the file, without the line break at the end
+        """
+        try:
+            with open(self.path(path), 'r', errors='replace') as text_file:
+                content = text_file.read()
+        except OSError:
+            return ''
+
+        if self.__profiler is not None:
+            self.__profiler.add_file_read(len(content))
+        return content.rstrip('\n')
+
+    def read_lines(self, path: str):
+        """The lines of a file, one at a time
+
+        :param path: Absolute path of the file, under the root
+        :return: Generator of strings, each one a line without the line break
+        """
+        try:
+            text_file = open(self.path(path), 'r', errors='replace')
+        except OSError:
+            return
+        bytes_read = 0
+        try:
+            with text_file:
+                for line in text_file:
+                    bytes_read += len(line)
+                    yield line.rstrip('\n')
+        finally:
+            if self.__profiler is not None:
+                self.__profiler.add_file_read(bytes_read)
+
+    def read_key_value(self, path: str, separator: str = '=') -> dict:
+        """Files in the 'KEY=value' format
+
+        Like '/etc/os-release'. Quotes around the values are removed, blank lines and
+        comments are ignored.
+
+        :param path: Absolute path of the file, under the root
+        :param separator: Character between the key and the value
+        :return: Dict containing the keys and values of the file
+        """
+        key_value = dict()
+        for line in self.read_lines(path):
+            line = line.strip()
+            if not line or line.startswith('#') or separator not in line:
+                continue
+            key, value = line.split(separator, 1)
+            key_value[key.strip()] = value.strip().strip('"').strip("'")
+
+        return key_value
+
+    def read_fields(self, path: str) -> dict:
+        """Files in the 'Key: value' format
+
+        Like '/proc/cpuinfo' and '/proc/meminfo'. When a key repeats, only the first
+        value is kept.
+
+        :param path: Absolute path of the file, under the root
+        :return: Dict containing the keys and values of the file
+        """
+        fields = dict()
+        for line in self.read_lines(path):
+            if ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            key = key.strip()
+            if key not in fields:
+                fields[key] = value.strip()
+
+        return fields
+
+    def mtime(self, path: str) -> int:
+        """Modification time of a file or directory
+
+        :param path: Absolute path of the file or directory, under the root
+        :return: Modification time in nanoseconds, or 0 if the path does not exist
+        """
+        try:
+            return os.stat(self.path(path)).st_mtime_ns
+        except OSError:
+            return 0
+
+    def list_dir(self, path: str) -> list:
+        """The names of the entries of a directory
+
+        :param path: Absolute path of the directory, under the root
+        :return: List of names, empty if the directory does not exist
+        """
+        try:
+            return os.listdir(self.path(path))
+        except OSError:
+            return []
+
+    def count_dirs(self, path: str) -> int:
+        """Number of subdirectories of a directory
+
+        :param path: Absolute path of the directory, under the root
+        :return: Number of subdirectories, 0 if the directory does not exist
+        """
+        try:
+            with os.scandir(self.path(path)) as entries:
+                return sum(1 for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            return 0
+
+    def exists(self, path: str) -> bool:
+        """Checks if a file or directory exists
+
+        :param path: Absolute path of the file or directory, under the root
+        :return: True if the path exists
+        """
+        return os.path.exists(self.path(path))
+
+    def is_dir(self, path: str) -> bool:
+        """Checks if a directory exists
+
+        :param path: Absolute path of the directory, under the root
+        :return: True if the directory exists
+        """
+        return os.path.isdir(self.path(path))
+
+
+if __name__ == '__main__':
+    fr = FileReader()
+    print(fr.read('/proc/sys/kernel/osrelease'))
+    print(fr.read_key_value('/etc/os-release'))
+    print(fr.read_fields('/proc/meminfo').get('MemTotal'))
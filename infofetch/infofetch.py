@@ -1,27 +1,109 @@
 #!/usr/bin/env python3
+import time
+
+# Início da importação dos módulos, medida pelo '--profile'
+IMPORT_START = time.perf_counter()
+
+import contextlib
+import json
+import os
 import re
+import signal
 import subprocess
 import sys
-import time
 
+import collector
+import config
+import containers
+import daemon
+import environment
+import factcache
 import osinfo
 import oslogos
+import profiler
+import report
+
+IMPORT_SECONDS = time.perf_counter() - IMPORT_START
+
+# Caracteres de cores invisíveis, que não contam na largura da linha
+RE_COLOR = re.compile(r'\x1b[^m]*m')
 
 
 class InfoFetch(object):
     """Create an object of type 'InfoFetch'"""
-    def __init__(self, os_name_id: str = None):
-        """Class constructor"""
+    def __init__(
+            self, os_name_id: str = None, fields: list = None, os_info: osinfo.OsInfo = None, values: dict = None,
+            profiler: profiler.Profiler = None, cache: factcache.FactCache = None, budget: float = None):
+        """Class constructor
+
+        :param os_name_id: Operating system identity used to choose the logo
+        :param fields: Names of the fields to display, in order. The default is all of them
+        :param os_info: Shared 'OsInfo'; the default is a new one with the persistent cache
+        :param values: Values of the fields already collected, like the ones from 'get_values'.
+            Nothing is probed when they are given
+        :param profiler: Records the time of the 'probes' and 'render' phases, or None to record nothing
+        :param cache: Keeps the last value of each field, shown when its probe does not finish
+            within 'budget', or None to keep nothing. Without 'os_info', the new 'OsInfo'
+            uses it too, or the persistent cache if it is not given
+        :param budget: Time limit, in seconds, to collect all the fields. The fields that are
+            not ready in time are shown with their last value, marked as stale, or left out
+        """
+        self.__fields = fields if fields else self.get_list_of_fields()
+        self.__values = values
+        self.__profiler = profiler
+        self.__budget = budget
+        self.__stale_fields = list()
+        self.__missing_fields = list()
         # Configura a identidade do sistema operacional
-        self.__os_info = osinfo.OsInfo()
-        self.__os_name_id = os_name_id if os_name_id else self.__os_info.get_name_id()
-        self.__os_logo = oslogos.Logo(os_name_id=self.__os_name_id)
+        if os_info is None:
+            os_info = osinfo.OsInfo(cache=cache if cache else factcache.FactCache(), profiler=profiler)
+        self.__cache = cache
+        self.__os_info = os_info
+        # A identidade do sistema é uma sonda como as outras, então não conta como renderização
+        if not os_name_id:
+            with self.__phase('probes', 'name-id'):
+                os_name_id = self.__os_info.get_name_id()
+        self.__os_logo = oslogos.Logo(os_name_id=os_name_id, os_info=self.__os_info)
         # Obtém as lista das linhas da logo e a lista das informações do sistema
-        self.accent_color = self.__os_logo.get_accent_color()
-        self.logo_as_list = self.__os_logo.get_colored_ansi_code_as_list()
-        self.info_list = self.__get_system_info()
+        with self.__phase('render', 'logo'):
+            self.accent_color = self.__os_logo.get_accent_color()
+            self.logo_as_list = self.__os_logo.get_colored_ansi_code_as_list()
+        with self.__phase('probes'):
+            self.info_list = self.__get_system_info()
         # A barra de cor será acrescentada na menor lista
-        self.__resolve_color_bar()
+        if 'colors' in self.__fields:
+            self.__resolve_color_bar()
+
+    def __phase(self, name: str, stage: str = None):
+        # Mede uma fase somente quando há um 'profiler'
+        return self.__profiler.phase(name, stage) if self.__profiler is not None else contextlib.nullcontext()
+
+    @staticmethod
+    def __get_terminal_width() -> int:
+        # Consultado uma única vez por renderização; sem terminal, usa $COLUMNS ou 80 como o 'tput'
+        try:
+            return os.get_terminal_size(sys.stdout.fileno()).columns
+        except (OSError, ValueError):
+            columns = os.environ.get('COLUMNS', '')
+            return int(columns) if columns.isdigit() else 80
+
+    @staticmethod
+    def __truncate(line: str, width: int) -> str:
+        # Corta a linha em 'width' colunas visíveis, sem quebrar os códigos de cores
+        result = list()
+        visible = 0
+        position = 0
+        for match in RE_COLOR.finditer(line + '\033[m'):
+            text = line[position:match.start()]
+            if visible + len(text) > width:
+                result.append(text[:width - visible])
+                return ''.join(result) + '\033[m'
+            result.append(text)
+            visible += len(text)
+            result.append(match.group())
+            position = match.end()
+
+        return line
 
     @staticmethod
     def __illusion_float(logo_list: list, info_list: list, width_chars: int) -> list:
@@ -30,45 +112,45 @@ class InfoFetch(object):
         # e o resto da linha são informações do sistema.
 
         # Listas com a mesma quantidade de itens
-        while len(logo_list) < len(info_list):
-            logo_list.append(' ')
-        while len(info_list) < len(logo_list):
-            info_list.append(' ')
+        lines = max(len(logo_list), len(info_list))
+        logo_list = logo_list + [' '] * (lines - len(logo_list))
+        info_list = info_list + [' '] * (lines - len(info_list))
 
+        terminal_width = InfoFetch.__get_terminal_width()
         full_list = list()  # Uma lista de linhas completas para exibir com 'print' será gerada
         for line_logo, line_info in zip(logo_list, info_list):
-            re_color = re.compile(r'\x1b[^m]*m')  # Remover caracteres de cores invisíveis da contagem
-            clean_line_logo = re_color.sub('', line_logo)
-            clean_line_info = re_color.sub('', line_info)
-            if len(clean_line_logo) < width_chars:  # Contar caracteres que faltam na linha da logo para 'width_chars'
-                missing_characters = width_chars - len(clean_line_logo)
-                line_logo = line_logo + ' '*missing_characters  # Acrescentar caracteres de espaços até preencher
+            # Contar caracteres que faltam na linha da logo para 'width_chars'
+            width_logo = len(RE_COLOR.sub('', line_logo))
+            if width_logo < width_chars:
+                line_logo = line_logo + ' ' * (width_chars - width_logo)  # Acrescentar espaços até preencher
+                width_logo = width_chars
 
             # Linha completa para o 'print', usando lista da logo e info
             full_line = line_logo + ' ' + line_info
 
-            # Comparar tamanho da linha com o tamanho do terminal
-            full_line_clean = clean_line_logo + ' ' + clean_line_info
-            terminal_width = int(subprocess.getoutput('tput cols'))
-
-            if len(full_line_clean) > terminal_width:
-                remove = len(full_line_clean) - terminal_width
-                full_line = full_line[:-remove]
+            # Comparar tamanho visível da linha com o tamanho do terminal
+            if width_logo + 1 + len(RE_COLOR.sub('', line_info)) > terminal_width:
+                full_line = InfoFetch.__truncate(full_line, terminal_width)
 
             full_list.append(full_line)
 
         return full_list
 
     def __resolve_color_bar(self) -> None:
-        # A barra de cor será acrescentada na menor lista
+        # A barra de cor será acrescentada na menor lista, uma única vez
         color_bar = '\033[41m  \033[42m  \033[43m  \033[44m  \033[45m  \033[46m  \033[47m  \033[m'
+        if color_bar in self.info_list or color_bar in self.logo_as_list:
+            return
         if len(self.info_list) <= len(self.logo_as_list):
             self.info_list.append(color_bar)
         else:
             self.logo_as_list.append(color_bar)
 
+    def get_title(self) -> str:
+        return self.__os_info.get_username() + '@' + self.__os_info.get_hostname()
+
     def get_header(self) -> str:
-        return self.accent_color + self.__os_info.get_username() + '@' + self.__os_info.get_hostname() + '\033[m'
+        return self.accent_color + self.get_title() + '\033[m'
 
     def get_header_decoration(self, header: str) -> str:
         len_header = len(header) - len(self.accent_color) - len('\033[m')
@@ -158,13 +240,14 @@ class InfoFetch(object):
         packages_details = ' - ' + native_packages_manager
         # Pacotes - Condição: Se houver flatpak ou snap
         if flatpak_packages or snap_packages:
-            native_packages_format = '{}={}'.format(native_packages_manager, native_packages)
-            flatpak_packages_format = ', flatpak={}'.format(flatpak_packages)
-            snap_packages_format = ', snap={}'.format(snap_packages)
+            # Gerenciadores sem pacotes vêm vazios e ficam de fora
+            package_counts = [
+                (native_packages_manager, native_packages), ('flatpak', flatpak_packages), ('snap', snap_packages)]
+            package_counts = [(manager, number) for manager, number in package_counts if number]
             # Variáveis de uso final
-            total_packages = str(int(native_packages) + int(flatpak_packages) + int(snap_packages))
-            packages_details = ' ({}{}{})'.format(
-                native_packages_format, flatpak_packages_format, snap_packages_format)
+            total_packages = str(sum(int(number) for _, number in package_counts))
+            packages_details = ' ({})'.format(
+                ', '.join('{}={}'.format(manager, number) for manager, number in package_counts))
         packages = total_packages + packages_details
         if not native_packages:
             packages = 'unknown'
@@ -179,44 +262,183 @@ class InfoFetch(object):
         browser = self.__os_info.get_browser()
         return browser if browser else 'unknown'
 
-    def __get_system_info(self) -> list:
-        header = self.get_header()
-        system_info_list = [
-            header,
-            self.get_header_decoration(header),
-            self.accent_color + 'OS: ' + '\033[m' + self.get_os_name(),
-            self.accent_color + 'Architecture: ' + '\033[m' + self.get_architecture(),
-            self.accent_color + 'Kernel: ' + '\033[m' + self.get_kernel(),
-            self.accent_color + 'Board: ' + '\033[m' + self.get_motherboard(),
-            self.accent_color + 'CPU: ' + '\033[m' + self.get_cpu(),
-            self.accent_color + 'GPU: ' + '\033[m' + self.get_gpu(),
-            self.accent_color + 'RAM: ' + '\033[m' + self.get_ram(),
-            self.accent_color + 'Swap: ' + '\033[m' + self.get_swap(),
-            self.accent_color + 'Resolution: ' + '\033[m' + self.get_resolution(),
-            self.accent_color + 'Uptime: ' + '\033[m' + self.get_uptime(),
-            self.accent_color + 'Shell: ' + '\033[m' + self.get_shell(),
-            self.accent_color + 'DE: ' + '\033[m' + self.get_desktop_environment(),
-            self.accent_color + 'WM: ' + '\033[m' + self.get_window_manager(),
-            self.accent_color + 'Display server: ' + '\033[m' + self.get_display_server(),
-            self.accent_color + 'Packages: ' + '\033[m' + self.get_packages(),
-            self.accent_color + 'Font: ' + '\033[m' + self.get_font(),
-            self.accent_color + 'Default browser: ' + '\033[m' + self.get_browser(),
+    @staticmethod
+    def __fields_table() -> list:
+        # Campos exibidos: (chave, rótulo, nome do método que formata o valor)
+        return [
+            ('os', 'OS', 'get_os_name'),
+            ('architecture', 'Architecture', 'get_architecture'),
+            ('kernel', 'Kernel', 'get_kernel'),
+            ('board', 'Board', 'get_motherboard'),
+            ('cpu', 'CPU', 'get_cpu'),
+            ('gpu', 'GPU', 'get_gpu'),
+            ('ram', 'RAM', 'get_ram'),
+            ('swap', 'Swap', 'get_swap'),
+            ('resolution', 'Resolution', 'get_resolution'),
+            ('uptime', 'Uptime', 'get_uptime'),
+            ('shell', 'Shell', 'get_shell'),
+            ('de', 'DE', 'get_desktop_environment'),
+            ('wm', 'WM', 'get_window_manager'),
+            ('display-server', 'Display server', 'get_display_server'),
+            ('packages', 'Packages', 'get_packages'),
+            ('font', 'Font', 'get_font'),
+            ('browser', 'Default browser', 'get_browser'),
         ]
 
-        # Remover informação indisponível
-        for info in system_info_list:
-            if info[-len('unknown'):] == 'unknown':
-                system_info_list.remove(info)
+    @staticmethod
+    def get_list_of_fields() -> list:
+        """Get a list of the fields that can be displayed
+
+        'title' is the 'user@hostname' header and 'colors' is the color bar.
+
+        :return: List with the field names, in the default order
+        """
+        return ['title'] + [key for key, _, _ in InfoFetch.__fields_table()] + ['colors']
+
+    def __get_system_info(self) -> list:
+        # Sem sessão gráfica ou num contêiner, grupos inteiros são desativados antes da coleta
+        disabled_fields = list()
+        if self.__values is None:
+            disabled_fields = environment.Environment.get_disabled_fields(
+                self.__os_info.is_headless(), self.__os_info.get_container())
+
+        probes = dict()
+        for key, _, method_name in self.__fields_table():
+            # Campos desativados não são nem consultados
+            if key in self.__fields and key not in disabled_fields:
+                probes[key] = getattr(self, method_name)
+        if 'title' in self.__fields:
+            probes['title'] = self.get_title
+
+        # As sondas são independentes, então rodam ao mesmo tempo
+        if self.__values is None:
+            probes_collector = collector.Collector()
+            self.__values = probes_collector.collect(probes, budget=self.__budget)
+            self.__remember_values(probes, probes_collector.get_out_of_budget())
+            self.__os_info.save_cache()
+
+        return self.__build_info_list()
+
+    def __remember_values(self, probes: dict, out_of_budget: list) -> None:
+        # Guarda o último valor de cada campo e usa o anterior para os que não ficaram prontos.
+        # Campos cuja sonda falhou não estão atrasados, então não têm valor antigo.
+        if self.__cache is None:
+            return
+
+        for key in probes:
+            if key in self.__values:
+                self.__cache.set('field:' + key, ['field'], self.__values[key])
+                continue
+            if key not in out_of_budget:
+                continue
+
+            self.__missing_fields.append(key)
+            found, value = self.__cache.get('field:' + key, ['field'])
+            if found and isinstance(value, str):
+                self.__values[key] = value
+                self.__stale_fields.append(key)
+
+    def get_missing_fields(self) -> list:
+        """Fields that were not ready within the time limit
+
+        Some of them may be displayed with the last known value, see 'get_stale_fields'.
+
+        :return: List with the field names
+        """
+        return list(self.__missing_fields)
+
+    def get_stale_fields(self) -> list:
+        """Fields displayed with the last known value
+
+        :return: List with the field names
+        """
+        return list(self.__stale_fields)
+
+    def __build_info_list(self) -> list:
+        values = self.__values
+        labels = {key: label for key, label, _ in self.__fields_table()}
+
+        system_info_list = list()
+        for key in self.__fields:
+            if key == 'title' and 'title' in values:
+                header = self.accent_color + values['title'] + '\033[m'
+                system_info_list.append(header)
+                system_info_list.append(self.get_header_decoration(header))
+
+            # Remover informação indisponível
+            elif key in labels:
+                value = values.get(key, 'unknown')
+                if value != 'unknown':
+                    # Valor antigo, de uma execução anterior
+                    if key in self.__stale_fields:
+                        value += ' \033[2m(stale)\033[m'
+                    system_info_list.append(self.accent_color + labels[key] + ': ' + '\033[m' + value)
 
         return system_info_list
 
+    def get_values(self) -> dict:
+        """Values of the fields
+
+        The values collected for the fields, without colors, that can be passed to another
+        'InfoFetch' with the 'values' parameter.
+
+        :return: Dict with the field name as key and its formatted value as value
+        """
+        return dict(self.__values)
+
     def main(self) -> None:
         """Shows system information
 
         Displays the system logo and system information.
         """
-        for item in self.__illusion_float(self.logo_as_list, self.info_list, 40):
-            print(item)
+        with self.__phase('render', 'layout'):
+            for item in self.__illusion_float(self.logo_as_list, self.info_list, 40):
+                print(item)
+
+    def watch(self, interval: float = 2.0) -> None:
+        """Shows system information and keeps it updated
+
+        The logo and the fields that do not change stay on the screen. RAM, swap and uptime
+        are sampled again every 'interval' seconds and only the lines that changed are
+        rewritten. Runs until interrupted.
+
+        :param interval: Seconds between two samples
+        """
+        # Campos que mudam enquanto o sistema roda: (chave, nome do método que formata o valor)
+        volatile_fields = [('ram', 'get_ram'), ('swap', 'get_swap'), ('uptime', 'get_uptime')]
+        volatile_fields = [(key, method_name) for key, method_name in volatile_fields if key in self.__fields]
+
+        lines = self.__illusion_float(self.logo_as_list, self.info_list, 40)
+        sys.stdout.write('\n'.join(lines) + '\n\033[?25l')  # Esconder o cursor
+        sys.stdout.flush()
+        try:
+            while True:
+                time.sleep(interval)
+                # Somente '/proc/meminfo' e '/proc/uptime' são lidos de novo
+                self.__os_info.refresh_volatile()
+                for key, method_name in volatile_fields:
+                    self.__values[key] = getattr(self, method_name)()
+                self.info_list = self.__build_info_list()
+                if 'colors' in self.__fields:
+                    self.__resolve_color_bar()
+
+                new_lines = self.__illusion_float(self.logo_as_list, self.info_list, 40)
+                if len(new_lines) != len(lines):
+                    # O número de linhas mudou: voltar ao início e redesenhar tudo
+                    output = '\033[{}F\033[J'.format(len(lines)) + '\n'.join(new_lines) + '\n'
+                else:
+                    # Subir até a linha, reescrevê-la e voltar para baixo da última linha
+                    output = str()
+                    for index, (line, new_line) in enumerate(zip(lines, new_lines)):
+                        if line != new_line:
+                            up = len(lines) - index
+                            output += '\033[{}F{}\033[K\033[{}E'.format(up, new_line, up)
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                lines = new_lines
+        finally:
+            sys.stdout.write('\033[?25h')  # Mostrar o cursor
+            sys.stdout.flush()
 
 
 class Args(object):
@@ -226,12 +448,56 @@ class Args(object):
 
         Handles and executes the arguments that have been passed.
         """
+        self.__fields = None
+        self.__daemon = False
+        self.__watch = None
+        self.__output = None
+        self.__root = None
+        self.__containers = False
+        self.__profiler = None
+        self.__profile = False
+        self.__trace = None
+        self.__budget = None
+        self.__refresh = False
+        self.__bench = None
+        self.__cache = None
+        self.__os_info = None
         self.__exec_args()
 
+    def __get_cache(self) -> factcache.FactCache:
+        # O cache só guarda informações do sistema em execução
+        if self.__cache is None and self.__root is None:
+            self.__cache = factcache.FactCache()
+        return self.__cache
+
+    def __get_os_info(self) -> osinfo.OsInfo:
+        # Uma única sessão de 'OsInfo' por processo, criada só se for necessária
+        if self.__os_info is None:
+            self.__os_info = osinfo.OsInfo(cache=self.__get_cache(), root=self.__root, profiler=self.__profiler)
+        return self.__os_info
+
     @staticmethod
-    def __exec_args() -> None:
-        # Verifica os argumentos e os exibe
-        for arg in sys.argv:
+    def get_value(arg: str, args: list) -> str:
+        """Value of an option
+
+        Accepts both '--option=value' and '--option value'.
+
+        :param arg: The option, like '--fields' or '--fields=os,cpu'
+        :param args: The arguments after the option; the value is taken from them when needed
+        :return: String with the value, empty if there is none
+        """
+        # Aceita tanto '--option=value' quanto '--option value'
+        if '=' in arg:
+            return arg.split('=', 1)[1]
+        return args.pop(0) if args else ''
+
+    def __exec_args(self) -> None:
+        # Verifica os argumentos e os exibe.
+        # Sem nenhuma opção que só exibe texto, as informações do sistema são exibidas no final.
+        fetch = True
+        args = list(sys.argv)
+        while args:
+            arg = args.pop(0)
             if '--help' in arg:
                 help_text = (
                     '--help ┐\n ┌─────┘\n'
@@ -243,21 +509,55 @@ class Args(object):
                     '--list-supported-logos  -Displays a list with the name of the logos...\n'
                     '                         that are supported by this script\n'
                     '--show-all-logos        -Displays/draws on the screen all logos that...\n'
-                    '                         are supported by this script'
+                    '                         are supported by this script\n'
+                    '--fields FIELD,...      -Displays only the fields in the list, in that...\n'
+                    '                         order. Can also be set with "fields = ..." in...\n'
+                    '                         ' + config.Config.default_path() + '\n'
+                    '                         Fields: ' + ', '.join(InfoFetch.get_list_of_fields()) + '\n'
+                    '--daemon                -Keeps the system information in memory and...\n'
+                    '                         serves it on ' + daemon.Daemon.default_socket_path() + '\n'
+                    '                         While it runs, infofetch only displays it\n'
+                    '--watch [SECONDS]       -Keeps the information on the screen, updating...\n'
+                    '                         RAM, swap and uptime every SECONDS (2)\n'
+                    '--json                  -Displays the raw values of the fields as a...\n'
+                    '                         JSON object, without logo or colors\n'
+                    '--ndjson                -Displays one JSON record per field, as soon...\n'
+                    '                         as each value is obtained\n'
+                    '--root DIR              -Reads the system information from the files...\n'
+                    '                         under DIR, like a mounted image. Information...\n'
+                    '                         that needs programs or the session is skipped\n'
+                    '--containers            -Displays the operating system and packages of...\n'
+                    '                         each running container (needs root). Use...\n'
+                    '                         with --json or --ndjson for raw values\n'
+                    '--profile               -Displays, after the information, the time...\n'
+                    '                         spent by each probe, the programs it executed...\n'
+                    '                         and the bytes it read\n'
+                    '--trace FILE            -Saves the probes, programs and render stages...\n'
+                    '                         of each thread as a Chrome trace (Perfetto)\n'
+                    '--budget MS             -Waits at most MS milliseconds for the...\n'
+                    '                         information. What is not ready is shown from...\n'
+                    '                         the last run, marked as stale, and updated in...\n'
+                    '                         the background for the next time. With...\n'
+                    '                         --json or --ndjson, it is null\n'
+                    '--bench N               -Runs everything N times, without displaying...\n'
+                    '                         it, and displays as JSON the p50, p95 and p99...\n'
+                    '                         times of each phase, with and without cache'
                 )
                 print(help_text)
                 print()
+                fetch = False
                 continue
 
             elif '--list-supported-logos' in arg:
                 print('--list-supported-logos ┐\n ┌─────────────────────┘')
-                print(oslogos.Logo().get_list_of_supported_logos())
+                print(oslogos.Logo.get_list_of_supported_logos())
                 print()
+                fetch = False
                 continue
 
             elif '--show-all-logos' in arg:
                 print('--show-all-logos ┐\n ┌───────────────┘')
-                logo = oslogos.Logo()
+                logo = oslogos.Logo(os_name_id='linux')
                 logo_list = logo.get_list_of_supported_logos()
                 for ansi_logo in logo_list:
                     logo.set_os_name_id(ansi_logo)
@@ -265,13 +565,214 @@ class Args(object):
                     print(logo.get_colored_ansi_code())
                     time.sleep(0.05)
                 print()
+                fetch = False
                 continue
 
+            elif arg == '--fields' or arg.startswith('--fields='):
+                self.__fields = config.Config.split_list(self.get_value(arg, args))
+
+            elif arg in ('--json', '--ndjson'):
+                self.__output = arg[2:]
+
+            elif arg == '--root' or arg.startswith('--root='):
+                self.__root = self.get_value(arg, args)
+                if not os.path.isdir(self.__root):
+                    print('Not a directory: {}'.format(self.__root), file=sys.stderr)
+                    sys.exit(1)
+
+            elif arg == '--profile':
+                self.__profile = True
+
+            elif arg == '--trace' or arg.startswith('--trace='):
+                self.__trace = self.get_value(arg, args)
+                if not self.__trace:
+                    print('Missing trace file', file=sys.stderr)
+                    sys.exit(1)
+
+            elif arg == '--budget' or arg.startswith('--budget='):
+                budget = self.get_value(arg, args)
+                try:
+                    self.__budget = max(float(budget), 0) / 1000
+                except ValueError:
+                    print('Invalid budget: {}'.format(budget), file=sys.stderr)
+                    sys.exit(1)
+
+            elif arg == '--bench' or arg.startswith('--bench='):
+                runs = self.get_value(arg, args)
+                if not runs.isdigit() or int(runs) < 1:
+                    print('Invalid number of runs: {}'.format(runs), file=sys.stderr)
+                    sys.exit(1)
+                self.__bench = int(runs)
+
+            elif arg == '--refresh':
+                # Uso interno: termina, sem exibir nada, o que ficou de fora do '--budget'
+                self.__refresh = True
+
+            elif arg == '--containers':
+                self.__containers = True
+
+            elif arg == '--daemon':
+                self.__daemon = True
+
+            elif arg == '--watch' or arg.startswith('--watch='):
+                # O intervalo é opcional
+                if '=' in arg:
+                    interval = arg.split('=', 1)[1]
+                elif args and args[0].replace('.', '', 1).isdigit():
+                    interval = args.pop(0)
+                else:
+                    interval = '2'
+                try:
+                    self.__watch = max(float(interval), 0.1)
+                except ValueError:
+                    print('Invalid interval: {}'.format(interval), file=sys.stderr)
+                    sys.exit(1)
+
+            else:
+                print('Unknown option: {}'.format(arg), file=sys.stderr)
+                sys.exit(1)
+
+        # O daemon atende todas as execuções deste usuário, que esperam o sistema em execução
+        if self.__daemon and self.__root is not None:
+            print('--daemon cannot be used with --root', file=sys.stderr)
+            sys.exit(1)
+
+        if self.__profile or self.__trace:
+            self.__profiler = profiler.Profiler(origin=IMPORT_START)
+            self.__profiler.add_phase('import', IMPORT_SECONDS, start=IMPORT_START)
+
+        if self.__daemon:
+            self.__serve()
+        elif self.__containers:
+            self.__list_containers()
+        elif fetch:
+            self.__fetch()
+
+    @staticmethod
+    def __get_session() -> dict:
+        return {name: os.environ.get(name, '') for name in daemon.SESSION_VARIABLES}
+
+    def __get_snapshot(self) -> dict:
+        # Todos os campos, sem cores, a identidade do sistema para escolher a logo e a sessão do daemon
+        os_info = self.__get_os_info()
+        os_info.refresh_volatile()
+        return {
+            'name-id': os_info.get_name_id(), 'values': InfoFetch(os_info=os_info).get_values(),
+            'session': self.__get_session()}
+
+    def __serve(self) -> None:
+        # Parar com SIGTERM também remove o socket
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            daemon.Daemon(self.__get_snapshot).serve_forever()
+        except KeyboardInterrupt:
+            pass
+        except OSError as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
+
+    def __list_containers(self) -> None:
+        container_list = containers.Containers().get_values()
+        if self.__output == 'json':
+            print(json.dumps(container_list))
+        elif self.__output == 'ndjson':
+            for container in container_list:
+                print(json.dumps(container))
+        else:
+            for container in container_list:
+                os_name = container['os']['pretty-name'] or container['os']['name'] or 'unknown'
+                packages = ', '.join(
+                    '{}={}'.format(manager, number) for manager, number in (container['packages'] or {}).items())
+                print('{:<8} {:<20} {:<40} {}'.format(
+                    container['pid'], container['hostname'] or '', os_name, packages if packages else 'unknown'))
+
+    def __fetch(self) -> None:
+        # A linha de comando tem prioridade sobre o arquivo de configuração
+        fields = self.__fields if self.__fields else config.Config().get_fields()
+        if fields:
+            unknown_fields = [field for field in fields if field not in InfoFetch.get_list_of_fields()]
+            if unknown_fields:
+                print('Unknown field: {}'.format(', '.join(unknown_fields)), file=sys.stderr)
+                sys.exit(1)
+
+        # Valores brutos para outros programas: sem logo, sem cores e sem o daemon
+        if self.__output is not None:
+            machine_report = report.Report(fields=fields, os_info=self.__get_os_info(), budget=self.__budget)
+            with self.__profiler.phase('probes') if self.__profiler else contextlib.nullcontext():
+                if self.__output == 'json':
+                    print(json.dumps(machine_report.get_values()))
+                else:
+                    machine_report.stream()
+            self.__finish_profile()
+            return
+
+        if self.__watch is not None:
+            try:
+                InfoFetch(fields=fields, os_info=self.__get_os_info()).watch(self.__watch)
+            except KeyboardInterrupt:
+                pass
+            return
+
+        if self.__bench is not None:
+            # Importado só aqui, para não pesar nas execuções normais
+            import bench
+            print(json.dumps(bench.Bench(runs=self.__bench, fields=fields).run(), indent=2))
+            return
+
+        if self.__refresh:
+            InfoFetch(fields=fields, os_info=self.__get_os_info(), cache=self.__get_cache())
+            return
+
+        # Com um daemon rodando, as informações vêm dele e nada é consultado.
+        # O daemon só conhece o sistema em execução, e o '--profile' mede as sondas deste processo.
+        snapshot = None
+        if self.__root is None and self.__profiler is None:
+            snapshot = daemon.Client().get_snapshot()
+        if snapshot and self.__is_valid_snapshot(snapshot):
+            fetch = InfoFetch(os_name_id=snapshot.get('name-id') or 'linux', fields=fields, values=snapshot['values'])
+        else:
+            # Os últimos valores só são guardados quando há um limite de tempo que os use
+            fetch = InfoFetch(
+                fields=fields, os_info=self.__get_os_info(), profiler=self.__profiler,
+                cache=self.__get_cache() if self.__budget is not None else None, budget=self.__budget)
+        fetch.main()
+        self.__finish_profile()
+
+        if fetch.get_missing_fields():
+            self.__refresh_in_background(fetch.get_missing_fields())
+
+    def __is_valid_snapshot(self, snapshot: dict) -> bool:
+        # Os valores são exibidos como estão, então precisam ser textos.
+        # Um daemon de outra sessão (serviço, SSH) vê outro ambiente gráfico, outro shell.
+        values = snapshot.get('values')
+        return isinstance(values, dict) and all(
+            isinstance(key, str) and isinstance(value, str) for key, value in values.items()) and (
+            snapshot.get('session') == self.__get_session())
+
+    @staticmethod
+    def __refresh_in_background(fields: list) -> None:
+        # Outro processo, separado deste, obtém os campos e atualiza o cache para a próxima vez
+        try:
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), '--refresh', '--fields', ','.join(fields)],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=True)
+        except OSError:
+            pass
+
+    def __finish_profile(self) -> None:
+        # A tabela vai para a saída de erros, para não se misturar com as informações
+        if self.__profile:
+            print(file=sys.stderr)
+            print(self.__profiler.get_table(), file=sys.stderr)
+        if self.__trace:
+            try:
+                self.__profiler.write_trace(self.__trace)
+            except OSError as error:
+                print(error, file=sys.stderr)
+                sys.exit(1)
+
 
 if __name__ == '__main__':
     del(sys.argv[0])
-    if sys.argv:
-        args = Args()
-    else:
-        fetch = InfoFetch()
-        fetch.main()
+    args = Args()
@@ -1,51 +1,153 @@
 #!/usr/bin/env python3
 # https://github.com/w-a-gomes/systemutils
-import subprocess
+import os
+import pwd
 import re
+import socket
+import sqlite3
+import struct
+import urllib.parse
+
+import command
+import environment
+import factcache
+import factstore
+import filereader
+import profiler
+
+# Banco de nomes dos dispositivos PCI, o mesmo usado pelo 'lspci'
+PCI_IDS_PATHS = ['/usr/share/hwdata/pci.ids', '/usr/share/misc/pci.ids', '/usr/share/pci.ids']
+
+# Fabricante (id PCI) -> nome curto, para quando o 'pci.ids' não existe ou tem o nome longo
+PCI_VENDORS = {
+    '8086': 'Intel',
+    '10de': 'NVIDIA',
+    '1002': 'AMD',
+    '1a03': 'ASPEED',
+    '102b': 'Matrox',
+    '15ad': 'VMware',
+    '80ee': 'VirtualBox',
+    '1234': 'QEMU',
+    '1af4': 'Virtio',
+    '1b36': 'Red Hat',
+    '1414': 'Microsoft',
+}
 
 
 class OsInfo(object):
     """Create an object of type 'OsInfo'
 
     Gets information about the operating system.
+
+    With another root directory, like a mounted image or the root of a container, the
+    information comes from the files under it. The information that depends on the running
+    session (environment variables, the current user, programs) is not available then,
+    unless a 'runner' and an 'environ' for that system are given.
     """
-    def __init__(self):
-        """Class constructor"""
-        self.__user = str()
-        self.__username = str()
-        self.__hostname = str()
-        self.__all_release_info = dict()
-        self.__pretty_name = str()
-        self.__name = str()
-        self.__name_id = str()
-        self.__codename = str()
-        self.__version = str()
-        self.__kernel = str()
-        self.__kernel_version = str()
-        self.__architecture = str()
-        self.__motherboard = str()
-        self.__motherboard_version = str()
-        self.__cpu = str()
-        self.__gpu = str()
-        self.__ram = str()
-        self.__ram_used = str()
-        self.__ram_free = str()
-        self.__swap = str()
-        self.__swap_used = str()
-        self.__swap_free = str()
-        self.__screen_resolution = str()
-        self.__uptime = str()
-        self.__shell = str()
-        self.__desktop_environment = str()
-        self.__desktop_environment_version = str()
-        self.__window_manager = str()
-        self.__package_manager = str()
-        self.__display_server = str()
-        self.__packages = str()
-        self.__flatpak_packages = str()
-        self.__snap_packages = str()
-        self.__font = str()
-        self.__browser = str()
+    def __init__(
+            self, cache: factcache.FactCache = None, root: str = None,
+            runner: command.CommandRunner = None, environ: dict = None, profiler: profiler.Profiler = None):
+        """Class constructor
+
+        :param cache: Persistent cache for the facts that rarely change, or None to always probe.
+            Not used with another root directory
+        :param root: Directory used as '/' for all the files read. The default is the real root
+        :param runner: Executes the programs. The default runs the programs of the system,
+            or none with another root directory, and remembers in 'cache' which are missing
+        :param environ: Environment variables of the session. The default is the one of this
+            process, or none with another root directory
+        :param profiler: Records what each fact spent to be obtained, or None to record nothing
+        """
+        self.__profiler = profiler
+        self.__files = filereader.FileReader(root, profiler=profiler)
+        self.__host = self.__files.get_root() == '/'
+        self.__cache = cache if self.__host else None
+        if runner is None:
+            runner = command.CommandRunner(
+                enabled=self.__host, profiler=profiler, tools=command.ToolIndex(cache=self.__cache))
+        if environ is None:
+            environ = os.environ if self.__host else dict()
+        self.__runner = runner
+        self.__environ = environ
+        self.__environment = environment.Environment(self.__files, self.__environ)
+        self.__facts = factstore.FactStore(profiler=profiler)
+
+    def get_root(self) -> str:
+        """The directory used as '/'
+
+        :return: String containing the absolute path of the root directory
+        """
+        return self.__files.get_root()
+
+    def refresh_volatile(self) -> None:
+        """Forgets the facts that change while the system runs
+
+        Memory and uptime are probed again on the next request.
+        """
+        self.__facts.forget('memory', 'uptime')
+
+    def save_cache(self) -> None:
+        """Writes the persistent cache to disk
+
+        Does nothing if this object has no cache.
+        """
+        if self.__cache is not None:
+            self.__cache.save()
+
+    def __cached(self, name: str, key, probe, ttl: float = None):
+        # Reutiliza o valor do cache persistente enquanto a chave de invalidação for a mesma
+        key = key()
+        found, value = self.__cache.get(name, key, ttl)
+        if found:
+            if self.__profiler is not None:
+                self.__profiler.set_cached()
+            return value
+
+        value = probe()
+        self.__cache.set(name, key, value)
+        return value
+
+    def __fact(self, name: str, probe, key=None, ttl: float = None):
+        # Cada fato é obtido uma única vez por sessão, mesmo se for vazio ou pedido por várias
+        # threads ao mesmo tempo. Com 'key' (uma função que gera a chave de invalidação),
+        # o fato também é guardado no cache persistente.
+        fact_probe = probe
+        if key is not None and self.__cache is not None:
+            fact_probe = lambda: self.__cached(name, key, probe, ttl)
+
+        if self.__profiler is not None:
+            return self.__facts.get(name, lambda: self.__profiler.probe(name, fact_probe))
+        return self.__facts.get(name, fact_probe)
+
+    def __boot_key(self) -> list:
+        # Válido até o próximo boot
+        return ['boot', self.__files.read('/proc/sys/kernel/random/boot_id').strip()]
+
+    def __mtime_key(self, *paths) -> list:
+        # Válido até que algum dos arquivos seja modificado
+        return ['mtime'] + [self.__files.mtime(path) for path in paths]
+
+    def is_headless(self) -> bool:
+        """Checks if there is no graphical session
+
+        Without one, or inside a container, the graphical information (resolution, window
+        manager, desktop environment version, font and browser) is not probed and is empty.
+
+        :return: True if there is no graphical session
+        """
+        return self.__fact('headless', self.__environment.is_headless)
+
+    def get_container(self) -> str:
+        """Container technology
+
+        Inside a container, the motherboard (the one of the host) is not probed and is empty.
+
+        :return: String like 'docker', 'podman' or 'lxc', or empty if not in a container
+        """
+        return self.__fact('container', self.__environment.get_container)
+
+    def __is_graphical(self) -> bool:
+        return not self.is_headless() and not self.get_container()
 
     def get_user(self) -> str:
         """The user name
@@ -54,13 +156,16 @@ class OsInfo(object):
 
         :return: String containing the user name
         """
-        if self.__user:
-            return self.__user
+        return self.__fact('user', self.__probe_user)
 
-        self.__user = subprocess.getoutput(
-            "cat /etc/passwd | grep `whoami` | awk -F ',' '{print $1}' | awk -F ':' '{print $5}'")
-
-        return self.__user
+    def __probe_user(self) -> str:
+        # O campo GECOS do '/etc/passwd' do usuário atual, até a primeira vírgula
+        if not self.__host:
+            return ''
+        try:
+            return pwd.getpwuid(os.getuid()).pw_gecos.split(',')[0]
+        except KeyError:
+            return ''
 
     def get_username(self) -> str:
         """The username
@@ -69,11 +174,7 @@ class OsInfo(object):
 
         :return: String containing username
         """
-        if self.__username:
-            return self.__username
-
-        self.__username = subprocess.getoutput('echo $USER')
-        return self.__username
+        return self.__fact('username', lambda: self.__environ.get('USER', ''))
 
     def get_hostname(self) -> str:
         """The host name
@@ -82,21 +183,21 @@ class OsInfo(object):
 
         :return: String containing the hostname
         """
-        if self.__hostname:
-            return self.__hostname
+        return self.__fact('hostname', self.__probe_hostname)
 
+    def __probe_hostname(self) -> str:
         # Fix $HOSTNAME missing
-        if subprocess.getoutput('cat /etc/hostname ; echo $?')[-1] == '0':
-            hostname = subprocess.getoutput('cat /etc/hostname')
-        else:
-            hostname = subprocess.getoutput('echo $HOSTNAME')
+        hostname = self.__files.read('/etc/hostname').strip()
+        if not hostname:
+            hostname = self.__environ.get('HOSTNAME', '')
+        if not hostname and self.__host:
+            hostname = socket.gethostname()
 
         # Fix $HOSTNAME in Fedora
         if 'fedora' in self.get_name().lower():
-            hostname = subprocess.getoutput('printf "${HOSTNAME%%.*}"')
+            hostname = hostname.split('.')[0]
 
-        self.__hostname = hostname
-        return self.__hostname
+        return hostname
 
     def get_all_release_info(self) -> dict:
         """cat /etc/os-release
@@ -105,37 +206,35 @@ class OsInfo(object):
 
         :return: Dict containing information from the '/etc/os-release' file
         """
-        if self.__all_release_info:
-            return self.__all_release_info
+        return self.__fact('all-release-info', self.__probe_all_release_info)
 
+    def __probe_all_release_info(self) -> dict:
         # Return var
-        all_release_info = dict()
-
-        cat_release = subprocess.getoutput('cat /etc/os-release').split('\n')
-        for item_release in cat_release:
-            items = item_release.split('=')
-            all_release_info[items[0]] = items[1].strip('"').strip("'")
+        all_release_info = self.__files.read_key_value('/etc/os-release')
+        if not all_release_info:
+            all_release_info = self.__files.read_key_value('/usr/lib/os-release')
 
         # HACK: Identify some known distributions that do not configure version information as they should
         hack_name = False
         name = str()
         name_id = str()
 
-        if 'ubuntu' in all_release_info['NAME'].lower():
+        if 'ubuntu' in all_release_info.get('NAME', '').lower():
             # Lubuntu
-            if 'openbox' in subprocess.getoutput('ls /usr/share/lubuntu/'):
+            if 'openbox' in self.__files.list_dir('/usr/share/lubuntu/'):
                 hack_name = True
                 name = 'Lubuntu'
                 name_id = 'lubuntu'
 
             # ubuntu Budgie
-            elif 'Budgie Welcome' in subprocess.getoutput('ubuntu-budgie-welcome.budgie-welcome --version'):
+            elif 'Budgie Welcome' in self.__runner.run(
+                    ['ubuntu-budgie-welcome.budgie-welcome', '--version']).stdout:
                 hack_name = True
                 name = 'Ubuntu Budgie'
                 name_id = 'ubuntubudgie'
 
             # Xubuntu
-            elif 'applications' in subprocess.getoutput('ls /usr/share/xubuntu/'):
+            elif 'applications' in self.__files.list_dir('/usr/share/xubuntu/'):
                 hack_name = True
                 name = 'Xubuntu'
                 name_id = 'xubuntu'
@@ -146,8 +245,7 @@ class OsInfo(object):
             if 'PRETTY_NAME' in all_release_info:
                 all_release_info['PRETTY_NAME'] = all_release_info['PRETTY_NAME'].replace('Ubuntu', name)
 
-        self.__all_release_info = all_release_info
-        return self.__all_release_info
+        return all_release_info
 
     def get_pretty_name(self) -> str:
         """Verbally formatted name
@@ -156,16 +254,7 @@ class OsInfo(object):
 
         :return: String containing pretty name
         """
-        if self.__pretty_name:
-            return self.__pretty_name
-
-        if not self.__all_release_info:
-            self.get_all_release_info()
-
-        if 'PRETTY_NAME' in self.__all_release_info:
-            self.__pretty_name = self.__all_release_info['PRETTY_NAME']
-
-        return self.__pretty_name
+        return self.get_all_release_info().get('PRETTY_NAME', '')
 
     def get_name(self) -> str:
         """Operating system name
@@ -174,15 +263,7 @@ class OsInfo(object):
 
         :return: String containing the name of the operating system
         """
-        if self.__name:
-            return self.__name
-
-        if not self.__all_release_info:
-            self.get_all_release_info()
-
-        if 'NAME' in self.__all_release_info:
-            self.__name = self.__all_release_info['NAME']
-        return self.__name
+        return self.get_all_release_info().get('NAME', '')
 
     def get_name_id(self) -> str:
         """Operating system identity
@@ -191,18 +272,10 @@ class OsInfo(object):
 
         :return: String containing the operating system ID
         """
-        if self.__name_id:
-            return self.__name_id
-
-        if not self.__all_release_info:
-            self.get_all_release_info()
-
-        if 'ID' in self.__all_release_info:
-            self.__name_id = self.__all_release_info['ID']
-        elif 'NAME' in self.__all_release_info:
-            self.__name_id = self.__all_release_info['NAME'].lower()
-
-        return self.__name_id
+        all_release_info = self.get_all_release_info()
+        if 'ID' in all_release_info:
+            return all_release_info['ID']
+        return all_release_info.get('NAME', '').lower()
 
     def get_codename(self) -> str:
         """Operating system codename
@@ -212,18 +285,10 @@ class OsInfo(object):
 
         :return: String containing the codename of the operating system
         """
-        if self.__codename:
-            return self.__codename
-
-        if not self.__all_release_info:
-            self.get_all_release_info()
-
-        if 'VERSION_CODENAME' in self.__all_release_info:
-            self.__codename = self.__all_release_info['VERSION_CODENAME']
-        elif 'CODENAME' in self.__all_release_info:
-            self.__codename = self.__all_release_info['CODENAME']
-
-        return self.__codename
+        all_release_info = self.get_all_release_info()
+        if 'VERSION_CODENAME' in all_release_info:
+            return all_release_info['VERSION_CODENAME']
+        return all_release_info.get('CODENAME', '')
 
     def get_version(self) -> str:
         """Operating system version
@@ -232,18 +297,10 @@ class OsInfo(object):
 
         :return: String containing the version of the operating system
         """
-        if self.__version:
-            return self.__version
-
-        if not self.__all_release_info:
-            self.get_all_release_info()
-
-        if 'VERSION_ID' in self.__all_release_info:
-            self.__version = self.__all_release_info['VERSION_ID']
-        elif 'VERSION' in self.__all_release_info:
-            self.__version = self.__all_release_info['VERSION']
-
-        return self.__version
+        all_release_info = self.get_all_release_info()
+        if 'VERSION_ID' in all_release_info:
+            return all_release_info['VERSION_ID']
+        return all_release_info.get('VERSION', '')
 
     def get_kernel(self) -> str:
         """Operating system kernel name
@@ -252,11 +309,7 @@ class OsInfo(object):
 
         :return: String containing the kernel name
         """
-        if self.__kernel:
-            return self.__kernel
-
-        self.__kernel = subprocess.getoutput('cat /proc/sys/kernel/ostype').title()
-        return self.__kernel
+        return self.__fact('kernel', lambda: self.__files.read('/proc/sys/kernel/ostype').strip().title())
 
     def get_kernel_version(self) -> str:
         """Operating system kernel version
@@ -265,426 +318,553 @@ class OsInfo(object):
 
         :return: String containing the kernel version
         """
-        if self.__kernel_version:
-            return self.__kernel_version
+        return self.__fact('kernel-version', self.__probe_kernel_version)
 
+    def __probe_kernel_version(self) -> str:
         regex = re.compile(r'(\.x\d.+|x\d.+)')
-        self.__kernel_version = regex.sub(
-            '', subprocess.getoutput('cat /proc/sys/kernel/osrelease'))
-
-        return self.__kernel_version
+        return regex.sub('', self.__files.read('/proc/sys/kernel/osrelease').strip())
 
     def get_architecture(self) -> str:
         """
 
         :return:
         """
-        if self.__architecture:
-            return self.__architecture
-
-        self.__architecture = subprocess.getoutput('getconf LONG_BIT').title()
-        return self.__architecture
+        # Como 'getconf LONG_BIT': o tamanho do 'long' do espaço de usuário
+        return self.__fact('architecture', lambda: str(struct.calcsize('l') * 8) if self.__host else '')
 
     def get_motherboard(self) -> str:
         """
 
         :return:
         """
-        if self.__motherboard:
-            return self.__motherboard
-
-        self.__motherboard = subprocess.getoutput(
-            'cat /sys/devices/virtual/dmi/id/product_name')
-        return self.__motherboard
+        if self.get_container():
+            return ''
+        return self.__fact(
+            'motherboard', lambda: self.__files.read('/sys/devices/virtual/dmi/id/product_name').strip(),
+            key=self.__boot_key)
 
     def get_motherboard_version(self) -> str:
         """
 
         :return:
         """
-        if self.__motherboard_version:
-            return self.__motherboard_version
-
-        self.__motherboard_version = subprocess.getoutput(
-            'cat /sys/devices/virtual/dmi/id/product_version')
-        return self.__motherboard_version
+        if self.get_container():
+            return ''
+        return self.__fact(
+            'motherboard-version', lambda: self.__files.read('/sys/devices/virtual/dmi/id/product_version').strip(),
+            key=self.__boot_key)
 
     def get_cpu(self) -> str:
         """
 
         :return:
         """
-        if self.__cpu:
-            return self.__cpu
-        self.__cpu = subprocess.getoutput(
-            "cat /proc/cpuinfo | grep 'model name' | sed -n 1p | sed 's/.*:.//g;s/(.*)//g'")
-        return self.__cpu
+        return self.__fact('cpu', self.__probe_cpu, key=self.__boot_key)
+
+    def __probe_cpu(self) -> str:
+        model_name = self.__files.read_fields('/proc/cpuinfo').get('model name', '')
+        return re.sub(r'\(.*\)', '', model_name)
 
     def get_gpu(self) -> str:
+        """Video cards
+
+        :return: String with every video card, separated by commas
+        """
+        return ', '.join(self.get_gpus())
+
+    def get_gpus(self) -> list:
+        """Every video card
+
+        Display controllers (PCI class 0x03) found in '/sys/bus/pci/devices', in the order
+        of their addresses. Nothing is executed.
+
+        :return: List of strings like ['Intel UHD Graphics 620', 'NVIDIA GP107M [GeForce MX350]']
+        """
+        return self.__fact('gpu', self.__probe_gpus, key=self.__boot_key)
+
+    def __probe_gpus(self) -> list:
+        devices = list()
+        for address in sorted(self.__files.list_dir('/sys/bus/pci/devices')):
+            path = '/sys/bus/pci/devices/' + address
+            # '0x030000' VGA, '0x030200' 3D, '0x038000' outros controladores de vídeo
+            if not self.__files.read(path + '/class').startswith('0x03'):
+                continue
+            devices.append((
+                self.__files.read(path + '/vendor').replace('0x', '').lower(),
+                self.__files.read(path + '/device').replace('0x', '').lower(),
+                self.__files.read(path + '/label').strip()))
+
+        names = self.__pci_names({(vendor, device) for vendor, device, _ in devices})
+        gpus = list()
+        for vendor_id, device_id, label in devices:
+            vendor, device = names.get((vendor_id, device_id), ('', ''))
+            vendor = PCI_VENDORS.get(vendor_id, vendor)
+            # Sem nome no 'pci.ids', mostra os ids como o 'lspci -nn'
+            device = device if device else '[{}:{}]'.format(vendor_id, device_id)
+
+            gpu = device if vendor.lower() in device.lower() else '{} {}'.format(vendor, device)
+            for dirt in ['Corporation', 'Core Processor', 'Integrated Graphics Controller']:
+                gpu = gpu.replace(dirt, '')
+            if label:
+                gpu = '{} ({})'.format(gpu, label)
+            gpus.append(' '.join(gpu.split()))
+
+        return gpus
+
+    def __pci_names(self, ids: set) -> dict:
+        # Lê o 'pci.ids' só até achar todos os ids; os fabricantes estão em ordem crescente
+        names = dict()
+        path = next((path for path in PCI_IDS_PATHS if self.__files.exists(path)), '')
+        if not ids or not path:
+            return names
+        last_vendor = max(vendor for vendor, _ in ids)
+
+        lines = self.__files.read_lines(path)
+        vendor_id, vendor = '', ''
+        for line in lines:
+            if not line or line.startswith('#'):
+                continue
+            if not line.startswith('\t'):
+                vendor_id, _, vendor = line.partition(' ')
+                # Fim dos fabricantes (e começo das classes, 'C 00 ...')
+                if len(vendor_id) != 4 or vendor_id > last_vendor:
+                    break
+                vendor = vendor.strip()
+            elif not line.startswith('\t\t'):
+                device_id, _, device = line[1:].partition(' ')
+                if (vendor_id, device_id) in ids:
+                    names[(vendor_id, device_id)] = (vendor, device.strip())
+                    if len(names) == len(ids):
+                        break
+        lines.close()
+
+        return names
+
+    def get_ram(self) -> str:
         """
 
         :return:
         """
-        if self.__gpu:
-            return self.__gpu
-
-        gpu_id = subprocess.getoutput("lspci |grep -i graphics|awk '{ print $1 }'")
-        gpu_label = str()
-
-        if gpu_id.replace(':', '').replace('.', '').isdigit():
-            gpu_label = subprocess.getoutput(
-                'cat "/sys/bus/pci/devices/0000:{}/label"'.format(gpu_id)).strip()
-            if 'cat: ' in gpu_label:
-                gpu_label = ''
+        return self.__format_memory('ram')
 
-        gpu_read = subprocess.getoutput('lspci | grep VGA')
-        if 'lspci:' in gpu_read or '/bin/sh:' in gpu_read:
-            return gpu_label
+    def get_memory_bytes(self) -> dict:
+        """Memory and swap in bytes
 
-        regex = re.findall(r'.+: (.+)', gpu_read)
-        gpu = str()
-        if regex:
-            gpu = regex[0]
+        Keys: 'ram', 'ram-used', 'ram-free', 'swap', 'swap-used' and 'swap-free'.
 
-        regex_to_remove = re.findall(r'\(.+\)', gpu_read)
-        if regex_to_remove:
-            gpu = gpu.replace(regex_to_remove[0], '')
-
-        if 'intel' in gpu.lower():
-            dirt_to_clean = ['Corporation', 'Core Processor', 'Integrated Graphics Controller']
-            for i in dirt_to_clean:
-                gpu = gpu.replace(i, '')
-
-        if 'virtualbox' in gpu.lower():
-            gpu = 'VirtualBox Graphics Adapter'
-
-        self.__gpu = '{}{}'.format(gpu.replace('  ', ' '), gpu_label).strip()
-        return self.__gpu
-
-    def get_ram(self) -> str:
+        :return: Dict with the sizes in bytes, empty if '/proc/meminfo' cannot be read
         """
+        return dict(self.__get_memory())
 
-        :return:
-        """
-        if self.__ram:
-            return self.__ram
+    def __get_memory(self) -> dict:
         # Somente um método pega todas as informações das memórias
-        # para evitar repetir o comando do shell
-
-        # Pegar linhas da memória ram e swap
-        memory_info = subprocess.getoutput("free -h").replace(',', '.').split('\n')
-        ram_line = memory_info[1].split(' ')  # memory_info[0] é o cabeçalho
-        swap_line = memory_info[2].split(' ')
-
-        # Lista para armazenar as informações das memórias ram e swap
-        ram_info = list()
-        swap_info = list()
-
-        # Preencher as lista com caracteres válidos, removendo caracteres vazios
-        for ram in ram_line:
-            if ram != '':
-                ram_info.append(ram)
-        for swap in swap_line:
-            if swap != '':
-                swap_info.append(swap)
-
-        # Atribuir valores da memória ram
-        self.__ram = ram_info[1]
-        self.__ram_used = ram_info[2]
-        self.__ram_free = ram_info[3]
-        # Atribuir valores da memória swap
-        self.__swap = swap_info[1]
-        self.__swap_used = swap_info[2]
-        self.__swap_free = swap_info[3]
-
-        return self.__ram
+        # para evitar ler o arquivo mais de uma vez
+        return self.__fact('memory', self.__probe_memory)
+
+    def __format_memory(self, key: str) -> str:
+        memory = self.__get_memory()
+        return self.__format_bytes(memory[key]) if memory else ''
+
+    def __probe_memory(self) -> dict:
+        meminfo = self.__files.read_fields('/proc/meminfo')
+        if 'MemTotal' not in meminfo:
+            return dict()
+
+        # Valores em kB, convertidos para bytes
+        memory = dict()
+        for key, value in meminfo.items():
+            if value.endswith(' kB') and value[:-3].strip().isdigit():
+                memory[key] = int(value[:-3]) * 1024
+
+        # Memória usada como no 'free': total menos disponível
+        ram_total = memory.get('MemTotal', 0)
+        ram_available = memory.get('MemAvailable', memory.get('MemFree', 0))
+        swap_total = memory.get('SwapTotal', 0)
+        swap_free = memory.get('SwapFree', 0)
+
+        return {
+            # Valores da memória ram
+            'ram': ram_total,
+            'ram-used': ram_total - ram_available,
+            'ram-free': memory.get('MemFree', 0),
+            # Valores da memória swap
+            'swap': swap_total,
+            'swap-used': swap_total - swap_free,
+            'swap-free': swap_free,
+        }
+
+    @staticmethod
+    def __format_bytes(number: int) -> str:
+        # Formato legível como o do 'free -h': 512Mi, 7.7Gi, 15Gi
+        units = ['B', 'Ki', 'Mi', 'Gi', 'Ti', 'Pi']
+        value = float(number)
+        unit = 0
+        while value >= 1024 and unit < len(units) - 1:
+            value /= 1024
+            unit += 1
+
+        if unit == 0:
+            return '{}{}'.format(int(value), units[unit])
+        if value < 10:
+            return '{:.1f}{}'.format(value, units[unit])
+        return '{}{}'.format(int(round(value)), units[unit])
 
     def get_ram_used(self) -> str:
         """
 
         :return:
         """
-        if self.__ram_used:
-            return self.__ram_used
-
-        self.get_ram()
-        return self.__ram_used
+        return self.__format_memory('ram-used')
 
     def get_ram_free(self) -> str:
         """
 
         :return:
         """
-        if self.__ram_free:
-            return self.__ram_free
-
-        self.get_ram()
-        return self.__ram_free
+        return self.__format_memory('ram-free')
 
     def get_swap(self) -> str:
         """
 
         :return:
         """
-        if self.__swap:
-            return self.__swap
-
-        self.get_ram()
-        return self.__swap
+        return self.__format_memory('swap')
 
     def get_swap_used(self) -> str:
         """
 
         :return:
         """
-        if self.__swap_used:
-            return self.__swap_used
-
-        self.get_ram()
-        return self.__swap_used
+        return self.__format_memory('swap-used')
 
     def get_swap_free(self) -> str:
         """
 
         :return:
         """
-        if self.__swap_free:
-            return self.__swap_free
-
-        self.get_ram()
-        return self.__swap_free
+        return self.__format_memory('swap-free')
 
     def get_screen_resolution(self) -> str:
         """
 
         :return:
         """
-        if self.__screen_resolution:
-            return self.__screen_resolution
+        if not self.__is_graphical():
+            return ''
+        return self.__fact('screen-resolution', self.__probe_screen_resolution)
 
-        if subprocess.getoutput('xrandr ; echo $?')[-1] == '0':
-            resolution = subprocess.getoutput(
-                "xrandr | grep current | awk -F , '{print $2}'")
-            self.__screen_resolution = resolution.replace(' current ', '').replace(' x ', 'x')
+    def __probe_screen_resolution(self) -> str:
+        xrandr = self.__runner.run(['xrandr'])
+        if not xrandr.ok():
+            return ''
 
-        return self.__screen_resolution
+        current = xrandr.grep('current')
+        resolution = xrandr.field(current[0], 1, ',') if current else ''
+        return resolution.replace('current ', '').replace(' x ', 'x')
 
     def get_uptime(self) -> str:
         """
 
         :return:
         """
-        if self.__uptime:
-            return self.__uptime
+        seconds = self.get_uptime_seconds()
+        if seconds is None:
+            return ''
+
+        # Formato do 'uptime -p': 1 week, 2 days, 3 hours, 4 minutes
+        minutes = seconds // 60
+        units = [('week', 60 * 24 * 7), ('day', 60 * 24), ('hour', 60), ('minute', 1)]
+        parts = list()
+        for unit_name, unit_minutes in units:
+            number = minutes // unit_minutes
+            minutes -= number * unit_minutes
+            if number:
+                parts.append('{} {}{}'.format(number, unit_name, '' if number == 1 else 's'))
 
-        uptime = subprocess.getoutput('uptime -p')
-        if uptime[:7] == 'uptime:':
-            self.__uptime = subprocess.getoutput('uptime').split(',')[0][9:].replace('up', '').strip() + ' Hs'
-        else:
-            self.__uptime = uptime.replace('up ', '')
+        return ', '.join(parts) if parts else '0 minutes'
+
+    def get_uptime_seconds(self) -> int:
+        """Time since boot
+
+        :return: Seconds since boot, or None if '/proc/uptime' cannot be read
+        """
+        return self.__fact('uptime', self.__probe_uptime)
 
-        return self.__uptime
+    def __probe_uptime(self) -> int:
+        uptime = self.__files.read('/proc/uptime').split()
+        return int(float(uptime[0])) if uptime else None
 
     def get_shell(self) -> str:
         """
 
         :return:
         """
-        if self.__shell:
-            return self.__shell
-
-        self.__shell = subprocess.getoutput('basename $SHELL')
-        return self.__shell
+        return self.__fact('shell', lambda: os.path.basename(self.__environ.get('SHELL', '')))
 
     def get_desktop_environment(self) -> str:
         """
 
         :return:
         """
-        if self.__desktop_environment:
-            return self.__desktop_environment
+        return self.__fact('desktop-environment', self.__probe_desktop_environment)
 
-        desktop_environment = subprocess.getoutput(
-            'echo $XDG_CURRENT_DESKTOP').replace(':', '-').strip()
+    def __probe_desktop_environment(self) -> str:
+        clean_desktop_environment = self.__environ.get('XDG_CURRENT_DESKTOP', '').replace(':', '-').strip()
 
         # Limpar
         dirt_to_clean = ['(', ')', "'", '"', 'X-']
         for cleaning_item in dirt_to_clean:
-            self.__desktop_environment = desktop_environment.replace(cleaning_item, '')
+            clean_desktop_environment = clean_desktop_environment.replace(cleaning_item, '')
 
         # Customizar
-        if 'kde' in self.__desktop_environment.lower():
-            self.__desktop_environment = 'Plasma (KDE)'
+        if 'kde' in clean_desktop_environment.lower():
+            return 'Plasma (KDE)'
 
-        return self.__desktop_environment
+        return clean_desktop_environment
 
     def get_desktop_environment_version(self) -> str:
         """
 
         :return:
         """
-        if self.__desktop_environment_version:
-            return self.__desktop_environment_version
+        if not self.__is_graphical():
+            return ''
+        # A versão só muda com atualizações, então vale por um dia para o mesmo DE
+        return self.__fact(
+            'desktop-environment-version', self.__probe_desktop_environment_version,
+            key=lambda: ['de', self.get_desktop_environment().lower()], ttl=24 * 60 * 60)
 
+    def __probe_desktop_environment_version(self) -> str:
+        de = self.get_desktop_environment().lower()
+        # (comando, linha a procurar, posição do campo da versão)
         cmd_version = {
-            # 'budgie': "budgie-desktop --version | awk '{print $2}'",
-            'cinnamon': "cinnamon --version | awk '{print $2}'",
+            # 'budgie': (['budgie-desktop', '--version'], None, 1),
+            'cinnamon': (['cinnamon', '--version'], None, 1),
             # deepin
-            'gnome': "gnome-shell --version | awk '{print $3}'",
-            'kde': "plasmashell --version | awk '{print $2}'",
+            'gnome': (['gnome-shell', '--version'], None, 2),
+            'kde': (['plasmashell', '--version'], None, 1),
             # lxde
-            'lxqt': "lxqt-about -v | grep liblxqt | awk '{print $2}'",
+            'lxqt': (['lxqt-about', '-v'], 'liblxqt', 1),
             # pantheon elementary
-            'xfce': "xfce4-about -V | grep xfce4-about | awk '{print $2}'",
+            'xfce': (['xfce4-about', '-V'], 'xfce4-about', 1),
         }
-        de = self.get_desktop_environment().lower()
         desktop_environment_version = str()
-        for cmd_version_key, cmd_version_value in cmd_version.items():
+        for cmd_version_key, (argv, pattern, index) in cmd_version.items():
             if cmd_version_key in de:
-                desktop_environment_version = subprocess.getoutput(cmd_version_value)
+                result = self.__runner.run(argv)
+                lines = result.grep(pattern) if pattern else result.lines()
+                if result.found and lines:
+                    desktop_environment_version = result.field(lines[0], index)
                 break
 
         # Limpar
         dirt_to_clean = ['(', ')', "'", '"', 'X-']
         for cleaning_item in dirt_to_clean:
-            self.__desktop_environment_version = desktop_environment_version.replace(cleaning_item, '')
-
-        # Customizar
-        error = ['bash: ', '/bin/sh: ']
-        for item_error in error:
-            if item_error in self.__desktop_environment_version.lower():
-                self.__desktop_environment_version = ''
-                break
+            desktop_environment_version = desktop_environment_version.replace(cleaning_item, '')
 
-        return self.__desktop_environment_version
+        return desktop_environment_version
 
     def get_window_manager(self) -> str:
         """
 
         :return:
         """
-        if self.__window_manager:
-            return self.__window_manager
-
-        cmd_xprop = subprocess.getoutput('xprop -root -notype _NET_SUPPORTING_WM_CHECK')
-        cmd_window_manager = subprocess.getoutput(
-            'xprop -id {} -notype -len 100 -f _NET_WM_NAME 8t | grep WM_KEY'.format(
-                cmd_xprop.split()[-1])).split('=')[-1].replace('"', '').strip()
-
-        if cmd_window_manager == '':
-            cmd_xprop = subprocess.getoutput('xprop -root -notype _NET_SUPPORTING_WM_CHECK')
-            cmd_window_manager = subprocess.getoutput(
-                'xprop -id {} -notype -len 100 -f _NET_WM_NAME 8t | grep WM_NAME'.format(
-                    cmd_xprop.split()[-1])).split('=')[-1].replace('"', '').strip()
-
-        self.__window_manager = cmd_window_manager.replace(',', ' | ').replace('(', '').replace(')', '')
-        if 'xprop:' in cmd_window_manager:
-            self.__window_manager = ''
+        if not self.__is_graphical():
+            return ''
+        return self.__fact('window-manager', self.__probe_window_manager)
+
+    def __probe_window_manager(self) -> str:
+        # A janela de verificação do gerenciador de janelas tem o nome dele
+        cmd_xprop = self.__runner.run(['xprop', '-root', '-notype', '_NET_SUPPORTING_WM_CHECK'])
+        if not cmd_xprop.ok() or not cmd_xprop.lines():
+            return ''
+
+        window_id = cmd_xprop.field(cmd_xprop.lines()[0], -1)
+        cmd_window = self.__runner.run(['xprop', '-id', window_id, '-notype', '-len', '100', '-f', '_NET_WM_NAME', '8t'])
+        cmd_window_manager = str()
+        for pattern in ['WM_KEY', 'WM_NAME']:
+            lines = cmd_window.grep(pattern) if cmd_window.ok() else []
+            if lines:
+                cmd_window_manager = lines[-1].split('=')[-1].replace('"', '').strip()
+                break
 
-        return self.__window_manager
+        return cmd_window_manager.replace(',', ' | ').replace('(', '').replace(')', '')
 
     def get_display_server(self) -> str:
         """
 
         :return:
         """
-        if self.__display_server:
-            return self.__display_server
-
-        self.__display_server = subprocess.getoutput('echo $XDG_SESSION_TYPE')
-        return self.__display_server
+        return self.__fact('display-server', lambda: self.__environ.get('XDG_SESSION_TYPE', ''))
 
     def get_package_manager(self) -> str:
         """
 
         :return:
         """
-        if self.__package_manager:
-            return self.__package_manager
-
-        cmd_packages = {
-            'dpkg': 'dpkg --get-selections | grep -cv deinstall$',
-            'rpm': 'rpm -qa | wc -l',
-            'pacman': 'pacman -Qq --color never | wc -l',
-            'eopkg': 'eopkg list-installed | wc -l',
-        }
-
-        for cmd_packages_key, cmd_packages_value in cmd_packages.items():
-            number = int(subprocess.getoutput(cmd_packages_value).split()[-1])
-
+        return self.__get_native_packages()[0]
+
+    def __get_native_packages(self) -> list:
+        # Vale até que o banco de dados de algum gerenciador de pacotes seja modificado.
+        # O rpm altera os arquivos do banco sem mudar o diretório, então os arquivos entram na chave.
+        return self.__fact('package-manager', self.__probe_package_manager, key=lambda: self.__mtime_key(
+            '/var/lib/dpkg/status', '/var/lib/pacman/local', '/var/lib/eopkg/package',
+            '/var/lib/rpm/rpmdb.sqlite', '/var/lib/rpm/rpmdb.sqlite-wal',
+            '/usr/lib/sysimage/rpm/rpmdb.sqlite', '/usr/lib/sysimage/rpm/rpmdb.sqlite-wal',
+            '/var/lib/rpm/Packages', '/var/lib/rpm/Packages.db', '/usr/lib/sysimage/rpm/Packages.db'))
+
+    def __probe_package_manager(self) -> list:
+        # O gerenciador é detectado pelo banco de dados que existe, e só ele é contado.
+        # A ordem segue a prioridade antiga, em que o último gerenciador com pacotes vencia.
+        counters = [
+            ('eopkg', self.__count_eopkg_packages),
+            ('pacman', self.__count_pacman_packages),
+            ('rpm', self.__count_rpm_packages),
+            ('dpkg', self.__count_dpkg_packages),
+        ]
+        for package_manager, counter in counters:
+            number = counter()
             if number > 0:
-                self.__package_manager = cmd_packages_key
-                self.__packages = str(number)
-
-        return self.__package_manager
+                return [package_manager, str(number)]
+
+        return ['', '']
+
+    def __count_dpkg_packages(self) -> int:
+        # Como 'dpkg --get-selections | grep -cv deinstall$': conta os pacotes
+        # marcados para instalar ou manter, lendo o arquivo 'status' linha a linha
+        number = 0
+        for line in self.__files.read_lines('/var/lib/dpkg/status'):
+            if line.startswith('Status: '):
+                want = line[len('Status: '):].split(' ', 1)[0]
+                if want in ('install', 'hold'):
+                    number += 1
+
+        return number
+
+    def __count_rpm_packages(self) -> int:
+        # O rpm 4.16+ guarda o banco de dados em sqlite
+        for rpmdb in ['/var/lib/rpm/rpmdb.sqlite', '/usr/lib/sysimage/rpm/rpmdb.sqlite']:
+            if not self.__files.exists(rpmdb):
+                continue
+            try:
+                # Caminhos com '?', '#' ou '%' precisam ser codificados na URI
+                connection = sqlite3.connect(
+                    'file:{}?mode=ro'.format(urllib.parse.quote(self.__files.path(rpmdb))), uri=True)
+                try:
+                    return connection.execute('SELECT COUNT(*) FROM Packages').fetchone()[0]
+                finally:
+                    connection.close()
+            except sqlite3.Error:
+                continue
+
+        # Bancos de dados antigos (Berkeley DB, ndb) só podem ser lidos pelo próprio rpm
+        for rpmdb in ['/var/lib/rpm/Packages', '/var/lib/rpm/Packages.db', '/usr/lib/sysimage/rpm/Packages.db']:
+            if self.__files.exists(rpmdb):
+                return len(self.__runner.run(['rpm', '-qa']).lines())
+
+        return 0
+
+    def __count_pacman_packages(self) -> int:
+        # Cada pacote instalado é um diretório em 'local'
+        return self.__files.count_dirs('/var/lib/pacman/local')
+
+    def __count_eopkg_packages(self) -> int:
+        # Cada pacote instalado é um diretório em 'package'
+        return self.__files.count_dirs('/var/lib/eopkg/package')
 
     def get_packages(self) -> str:
         """
 
         :return:
         """
-        if self.__packages:
-            return self.__packages
+        return self.__get_native_packages()[1]
+
+    def get_package_counts(self) -> dict:
+        """Number of installed packages per package manager
+
+        Includes the native package manager, flatpak and snap; managers without packages
+        are left out.
 
-        self.get_package_manager()
+        :return: Dict like {'dpkg': 1834, 'flatpak': 12}
+        """
+        package_counts = dict()
+        package_manager, packages = self.__get_native_packages()
+        if package_manager and packages:
+            package_counts[package_manager] = int(packages)
+        if self.get_flatpak_packages():
+            package_counts['flatpak'] = int(self.get_flatpak_packages())
+        if self.get_snap_packages():
+            package_counts['snap'] = int(self.get_snap_packages())
 
-        return self.__packages
+        return package_counts
 
     def get_flatpak_packages(self) -> str:
         """
 
         :return:
         """
-        if self.__flatpak_packages:
-            return self.__flatpak_packages
-
-        number = int(subprocess.getoutput('flatpak list | wc -l').split()[-1])
-        if number > 0:
-            self.__flatpak_packages = str(number)
+        # O 'flatpak list' conta os aplicativos e os runtimes
+        return self.__fact('flatpak-packages', self.__probe_flatpak_packages, key=lambda: self.__mtime_key(
+            '/var/lib/flatpak/app', '/var/lib/flatpak/runtime', os.path.expanduser('~/.local/share/flatpak/app'),
+            os.path.expanduser('~/.local/share/flatpak/runtime')))
 
-        return self.__flatpak_packages
+    def __probe_flatpak_packages(self) -> str:
+        flatpak = self.__runner.run(['flatpak', 'list'])
+        number = len(flatpak.lines()) if flatpak.ok() else 0
+        return str(number) if number > 0 else ''
 
     def get_snap_packages(self) -> str:
         """
 
         :return:
         """
-        if self.__snap_packages:
-            return self.__snap_packages
-
-        # Remove cabeçalho com: grep -v "^Name"
-        # number = int(subprocess.getoutput('snap list | grep -v "^Name" | wc -l').split()[-1])
+        return self.__fact(
+            'snap-packages', self.__probe_snap_packages, key=lambda: self.__mtime_key('/var/lib/snapd/state.json'))
 
+    def __probe_snap_packages(self) -> str:
         # Remove cabeçalho com '-1' no fim
-        number = int(subprocess.getoutput('snap list | wc -l').split()[-1]) - 1
-        if number > 0:
-            self.__snap_packages = str(number)
-
-        return self.__snap_packages
+        snap = self.__runner.run(['snap', 'list'])
+        number = len(snap.lines()) - 1 if snap.ok() else 0
+        return str(number) if number > 0 else ''
 
     def get_font(self) -> str:
         """
 
         :return:
         """
-        if self.__font:
-            return self.__font
+        if not self.__is_graphical():
+            return ''
+        # Vale até que a configuração do fontconfig mude
+        return self.__fact('font', self.__probe_font, key=lambda: self.__mtime_key(
+            '/etc/fonts/conf.d', '/etc/fonts/local.conf', os.path.expanduser('~/.config/fontconfig/fonts.conf')),
+            ttl=24 * 60 * 60)
 
-        self.__font = re.findall(r':.(.+)', subprocess.getoutput('fc-match'))[0].replace('"', '')
-        return self.__font
+    def __probe_font(self) -> str:
+        fc_match = self.__runner.run(['fc-match'])
+        font = re.findall(r':.(.+)', fc_match.stdout) if fc_match.ok() else []
+        return font[0].replace('"', '') if font else ''
 
     def get_browser(self) -> str:
         """
 
         :return:
         """
-        if self.__browser:
-            return self.__browser
+        if not self.__is_graphical():
+            return ''
+        # Vale até que a associação de aplicativos padrão mude
+        return self.__fact('browser', self.__probe_browser, key=lambda: self.__mtime_key(
+            os.path.expanduser('~/.config/mimeapps.list'), '/usr/share/applications/mimeapps.list'),
+            ttl=24 * 60 * 60)
+
+    def __probe_browser(self) -> str:
+        xdg_settings = self.__runner.run(['xdg-settings', 'get', 'default-web-browser'])
+        if not xdg_settings.ok():
+            return ''
 
-        desktop_file = subprocess.getoutput('xdg-settings get default-web-browser').lower()
+        desktop_file = xdg_settings.stdout.strip().lower()
         browser = desktop_file.replace('.desktop', '').replace('-', ' ')
         bad_list = [
-            '/bin/sh:', 'xdg-settings:', 'leafpad', 'kwrite', 'gedit', 'kate', 'debian', 'sensible']
+            'leafpad', 'kwrite', 'gedit', 'kate', 'debian', 'sensible']
         for bad_item in bad_list:
             if bad_item in browser:
                 browser = ''
@@ -695,9 +875,7 @@ class OsInfo(object):
                 browser = regex_browser[0]
 
         browser = '' if browser == ' ' else browser
-        self.__browser = browser.title()
-
-        return self.__browser
+        return browser.title()
 
 
 if __name__ == '__main__':
@@ -717,6 +895,7 @@ if __name__ == '__main__':
     print('        motherboard-version:', oi.get_motherboard_version())
     print('                        cpu:', oi.get_cpu())
     print('                        gpu:', oi.get_gpu())
+    print('                       gpus:', oi.get_gpus())
     print('                        ram:', oi.get_ram())
     print('                   ram-used:', oi.get_ram_used())
     print('                   ram-free:', oi.get_ram_free())
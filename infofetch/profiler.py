@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+import contextlib
+import json
+import os
+import threading
+import time
+
+
+class _Probe(object):
+    # O que uma sonda (probe) gastou
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.processes = 0
+        self.files = 0
+        self.bytes_read = 0
+        self.cached = False
+
+
+class Profiler(object):
+    """Create an object of type 'Profiler'
+
+    Records how long each probe took, how many programs it executed, how many files and bytes it read
+    and whether its value came from the persistent cache, as well as the total time of each
+    phase. The work of a probe is attributed to the innermost probe running on the same thread.
+
+    Every probe, program, phase and wait is also recorded as a span of the thread where it ran,
+    which can be saved as a Chrome trace (chrome://tracing, Perfetto).
+    """
+    def __init__(self, origin: float = None):
+        """Class constructor
+
+        :param origin: Moment, from 'time.perf_counter', that is the start of the trace.
+            The default is the creation of this object
+        """
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__probes = list()
+        self.__phases = dict()
+        self.__origin = origin if origin is not None else time.perf_counter()
+        self.__events = list()
+        self.__threads = dict()
+
+    def __add_event(self, name: str, category: str, start: float, end: float, args: dict = None) -> None:
+        # Evento completo ('X') do formato Trace Event, com tempos em microssegundos
+        thread = threading.current_thread()
+        event = {
+            'name': name, 'cat': category, 'ph': 'X', 'pid': os.getpid(), 'tid': thread.native_id,
+            'ts': round((start - self.__origin) * 1000000, 3), 'dur': round((end - start) * 1000000, 3)}
+        if args:
+            event['args'] = args
+        with self.__lock:
+            self.__events.append(event)
+            self.__threads[thread.native_id] = thread.name
+
+    def __current(self) -> _Probe:
+        stack = getattr(self.__local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def probe(self, name: str, function):
+        """Runs a probe and records what it spent
+
+        :param name: Name of the probe
+        :param function: Function without arguments that does the work of the probe
+        :return: The value returned by 'function'
+        """
+        probe = _Probe(name)
+        with self.__lock:
+            self.__probes.append(probe)
+
+        if getattr(self.__local, 'stack', None) is None:
+            self.__local.stack = list()
+        self.__local.stack.append(probe)
+        start = time.perf_counter()
+        try:
+            return function()
+        finally:
+            end = time.perf_counter()
+            probe.seconds = end - start
+            self.__local.stack.pop()
+            self.__add_event(name, 'probe', start, end, {
+                'processes': probe.processes, 'files': probe.files, 'bytes-read': probe.bytes_read,
+                'cached': probe.cached})
+
+    @contextlib.contextmanager
+    def process(self, argv: list):
+        """Counts a program executed by the current probe and measures it
+
+        Use with 'with' around the execution.
+
+        :param argv: The command and its arguments
+        """
+        probe = self.__current()
+        if probe is not None:
+            probe.processes += 1
+        self.__add_total('processes', 1)
+        with self.span(os.path.basename(argv[0]), 'process', {'argv': ' '.join(argv)}):
+            yield
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, args: dict = None):
+        """Records a block of code as a span of the trace
+
+        Use with 'with'.
+
+        :param name: Name of the span
+        :param category: Kind of span, like 'wait'
+        :param args: Details shown with the span
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__add_event(name, category, start, time.perf_counter(), args)
+
+    def add_file_read(self, bytes_read: int) -> None:
+        """Counts a file read by the current probe
+
+        :param bytes_read: Number of bytes read from the file
+        """
+        probe = self.__current()
+        if probe is not None:
+            probe.files += 1
+            probe.bytes_read += bytes_read
+        self.__add_total('files', 1)
+        self.__add_total('bytes-read', bytes_read)
+
+    def set_cached(self) -> None:
+        """Marks that the value of the current probe came from the persistent cache"""
+        probe = self.__current()
+        if probe is not None:
+            probe.cached = True
+
+    def __add_total(self, name: str, number: int) -> None:
+        with self.__lock:
+            self.__phases[name] = self.__phases.get(name, 0) + number
+
+    def add_phase(self, name: str, seconds: float, start: float = None) -> None:
+        """Adds time to a phase
+
+        :param name: Name of the phase, like 'probes' or 'render'
+        :param seconds: Time spent
+        :param start: Moment, from 'time.perf_counter', when the time started to be spent.
+            Without it, nothing is added to the trace
+        """
+        self.__add_total(name, seconds)
+        if start is not None:
+            self.__add_event(name, 'phase', start, start + seconds)
+
+    @contextlib.contextmanager
+    def phase(self, name: str, stage: str = None):
+        """Measures the time of a block of code as part of a phase
+
+        Use with 'with'.
+
+        :param name: Name of the phase, like 'probes' or 'render'
+        :param stage: Name of the span in the trace. The default is the name of the phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.__add_total(name, end - start)
+            self.__add_event(stage if stage else name, 'phase', start, end)
+
+    def get_probes(self) -> list:
+        """What each probe spent
+
+        :return: List of dicts with 'name', 'ms', 'processes', 'files', 'bytes-read' and 'cached', the slowest first
+        """
+        with self.__lock:
+            probes = list(self.__probes)
+        return [
+            {'name': probe.name, 'ms': round(probe.seconds * 1000, 3), 'processes': probe.processes,
+             'files': probe.files, 'bytes-read': probe.bytes_read, 'cached': probe.cached}
+            for probe in sorted(probes, key=lambda probe: probe.seconds, reverse=True)]
+
+    def get_phase(self, name: str):
+        """Total of a phase
+
+        :param name: Name of the phase
+        :return: The total, 0 if nothing was added to the phase
+        """
+        with self.__lock:
+            return self.__phases.get(name, 0)
+
+    def get_trace(self) -> dict:
+        """The spans in the Trace Event format
+
+        :return: Dict with 'traceEvents', ready to be saved as JSON
+        """
+        with self.__lock:
+            events = list(self.__events)
+            threads = dict(self.__threads)
+
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': name}}
+            for tid, name in threads.items()]
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, path: str) -> None:
+        """Saves the spans as a Chrome trace
+
+        :param path: Path of the JSON file
+        """
+        with open(path, 'w', encoding='utf-8') as trace_file:
+            json.dump(self.get_trace(), trace_file)
+
+    def get_table(self) -> str:
+        """What was spent, as a text table
+
+        :return: String with one line per probe and the totals at the end
+        """
+        lines = ['{:<28} {:>10} {:>6} {:>6} {:>10}  {}'.format('PROBE', 'TIME', 'PROCS', 'FILES', 'BYTES', 'CACHE')]
+        for probe in self.get_probes():
+            lines.append('{:<28} {:>8.2f}ms {:>6} {:>6} {:>10}  {}'.format(
+                probe['name'], probe['ms'], probe['processes'], probe['files'], probe['bytes-read'],
+                'yes' if probe['cached'] else '-'))
+
+        lines.append('')
+        for phase in ['import', 'probes', 'render']:
+            lines.append('{:<28} {:>8.2f}ms'.format('total ' + phase, self.get_phase(phase) * 1000))
+        lines.append('{:<28} {:>10} {:>6} {:>6} {:>10}'.format(
+            'total', '', self.get_phase('processes'), self.get_phase('files'), self.get_phase('bytes-read')))
+
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    p = Profiler()
+
+    def slow_probe():
+        with p.process(['sleep', '0.01']):
+            time.sleep(0.01)
+        p.add_file_read(120)
+        return 'value'
+
+    with p.phase('probes'):
+        p.probe('slow', slow_probe)
+    print(p.get_table())
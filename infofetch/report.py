@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import json
+import sys
+
+import collector
+import environment
+import factcache
+import osinfo
+
+
+class Report(object):
+    """Create an object of type 'Report'
+
+    System information as raw typed values, for other programs to read. Sizes are integers
+    in bytes, the uptime is in seconds, the video cards are a list and the packages are
+    counted per package manager. Nothing is decorated and no logo is drawn.
+    """
+    def __init__(self, fields: list = None, os_info: osinfo.OsInfo = None, budget: float = None):
+        """Class constructor
+
+        :param fields: Names of the fields to report, like the ones of 'InfoFetch'. The default is all of them
+        :param os_info: Shared 'OsInfo'; the default is a new one with the persistent cache
+        :param budget: Time limit, in seconds, to collect all the fields. The fields that are
+            not ready in time are null
+        """
+        self.__os_info = os_info if os_info else osinfo.OsInfo(cache=factcache.FactCache())
+        self.__budget = budget
+        probes = self.__probes_table()
+        self.__fields = [field for field in fields if field in probes] if fields else list(probes)
+
+    def __probes_table(self) -> dict:
+        # Campo -> método que obtém o valor bruto
+        return {
+            'title': self.__get_title,
+            'os': self.__get_os,
+            'architecture': self.__get_architecture,
+            'kernel': self.__get_kernel,
+            'board': self.__get_board,
+            'cpu': self.__os_info.get_cpu,
+            'gpu': self.__os_info.get_gpus,
+            'ram': self.__get_ram,
+            'swap': self.__get_swap,
+            'resolution': self.__os_info.get_screen_resolution,
+            'uptime': self.__os_info.get_uptime_seconds,
+            'shell': self.__os_info.get_shell,
+            'de': self.__get_desktop_environment,
+            'wm': self.__os_info.get_window_manager,
+            'display-server': self.__os_info.get_display_server,
+            'packages': self.__os_info.get_package_counts,
+            'font': self.__os_info.get_font,
+            'browser': self.__os_info.get_browser,
+        }
+
+    @staticmethod
+    def __or_none(value):
+        # Informação indisponível vira 'null' no JSON
+        return value if value or value == 0 else None
+
+    def __get_title(self) -> dict:
+        return {
+            'username': self.__or_none(self.__os_info.get_username()),
+            'hostname': self.__or_none(self.__os_info.get_hostname())}
+
+    def __get_os(self) -> dict:
+        return {
+            'name': self.__or_none(self.__os_info.get_name()),
+            'pretty-name': self.__or_none(self.__os_info.get_pretty_name()),
+            'id': self.__or_none(self.__os_info.get_name_id()),
+            'version': self.__or_none(self.__os_info.get_version()),
+            'codename': self.__or_none(self.__os_info.get_codename())}
+
+    def __get_architecture(self) -> int:
+        architecture = self.__os_info.get_architecture()
+        return int(architecture) if architecture.isdigit() else None
+
+    def __get_kernel(self) -> dict:
+        return {
+            'name': self.__or_none(self.__os_info.get_kernel()),
+            'version': self.__or_none(self.__os_info.get_kernel_version())}
+
+    def __get_board(self) -> dict:
+        return {
+            'name': self.__or_none(self.__os_info.get_motherboard()),
+            'version': self.__or_none(self.__os_info.get_motherboard_version())}
+
+    def __get_memory(self, prefix: str) -> dict:
+        memory = self.__os_info.get_memory_bytes()
+        if not memory:
+            return None
+        return {'total': memory[prefix], 'used': memory[prefix + '-used'], 'free': memory[prefix + '-free']}
+
+    def __get_ram(self) -> dict:
+        return self.__get_memory('ram')
+
+    def __get_swap(self) -> dict:
+        return self.__get_memory('swap')
+
+    def __get_desktop_environment(self) -> dict:
+        return {
+            'name': self.__or_none(self.__os_info.get_desktop_environment()),
+            'version': self.__or_none(self.__os_info.get_desktop_environment_version())}
+
+    def __collect(self, on_result=None) -> dict:
+        # Sem sessão gráfica ou num contêiner, alguns campos ficam nulos sem serem consultados
+        disabled_fields = environment.Environment.get_disabled_fields(
+            self.__os_info.is_headless(), self.__os_info.get_container())
+        probes = self.__probes_table()
+        values = collector.Collector().collect(
+            {field: probes[field] for field in self.__fields if field not in disabled_fields}, on_result=on_result,
+            budget=self.__budget)
+        self.__os_info.save_cache()
+        return values
+
+    def get_values(self) -> dict:
+        """Values of the fields
+
+        Fields whose probe failed or did not finish in time are null.
+
+        :return: Dict with the field name as key and its raw value as value, in the order of the fields
+        """
+        values = self.__collect()
+        return {field: self.__or_none(values.get(field)) for field in self.__fields}
+
+    def stream(self, output=None) -> None:
+        """Writes one JSON record per field as soon as each probe finishes (NDJSON)
+
+        Each line is like '{"field": "uptime", "value": 3600}'. Fields whose probe failed or
+        did not finish in time are written at the end with a null value.
+
+        :param output: File where the lines are written. The default is the standard output
+        """
+        output = output if output else sys.stdout
+
+        def write(field: str, value) -> None:
+            output.write(json.dumps({'field': field, 'value': self.__or_none(value)}) + '\n')
+            output.flush()
+
+        values = self.__collect(on_result=write)
+        for field in self.__fields:
+            if field not in values:
+                write(field, None)
+
+
+if __name__ == '__main__':
+    report = Report(fields=['title', 'ram', 'uptime', 'packages'])
+    print(json.dumps(report.get_values(), indent=2))
+    report.stream()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Os módulos do infofetch e do benchmark se importam pelo nome, a partir dos seus diretórios
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPOSITORY_DIR, 'infofetch'))
+sys.path.insert(0, os.path.join(REPOSITORY_DIR, 'benchmarks'))
@@ -0,0 +1,53 @@
+import threading
+import time
+
+import collector
+
+
+def test_returns_the_value_of_each_probe():
+    assert collector.Collector().collect({'a': lambda: 1, 'b': lambda: 'b'}) == {'a': 1, 'b': 'b'}
+
+
+def test_probe_over_its_timeout_is_left_out():
+    release = threading.Event()
+    start = time.monotonic()
+    values = collector.Collector(max_workers=1, timeout=0.2).collect(
+        {'stuck': release.wait, 'after': lambda: 'after'})
+    release.set()
+
+    assert values == {'after': 'after'}
+    assert time.monotonic() - start < 2
+
+
+def test_failing_probe_is_left_out_and_reported(capsys):
+    values = collector.Collector().collect({'ok': lambda: 'ok', 'broken': lambda: int('')})
+
+    assert values == {'ok': 'ok'}
+    assert 'broken' in capsys.readouterr().err
+
+
+def test_budget_abandons_the_probes_that_are_not_ready():
+    release = threading.Event()
+    probes_collector = collector.Collector(max_workers=1, timeout=5.0)
+    start = time.monotonic()
+    values = probes_collector.collect(
+        {'fast': lambda: 'fast', 'stuck': release.wait, 'queued': lambda: 'queued'}, budget=0.2)
+    release.set()
+
+    assert values == {'fast': 'fast'}
+    assert sorted(probes_collector.get_out_of_budget()) == ['queued', 'stuck']
+    assert time.monotonic() - start < 2
+
+
+def test_errors_are_not_out_of_budget():
+    probes_collector = collector.Collector()
+    probes_collector.collect({'broken': lambda: int('')}, budget=5.0)
+
+    assert probes_collector.get_out_of_budget() == []
+
+
+def test_results_are_reported_as_they_finish():
+    reported = list()
+    collector.Collector().collect({'a': lambda: 1}, on_result=lambda name, value: reported.append((name, value)))
+
+    assert reported == [('a', 1)]
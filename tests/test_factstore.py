@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+import factstore
+
+
+def test_concurrent_requests_compute_the_fact_once():
+    store = factstore.FactStore()
+    calls = list()
+    started = threading.Event()
+    release = threading.Event()
+
+    def probe():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    values = list()
+    threads = [threading.Thread(target=lambda: values.append(store.get('fact', probe))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert values == ['value'] * 8
+
+
+def test_empty_values_are_remembered():
+    store = factstore.FactStore()
+    calls = list()
+    for _ in range(3):
+        store.get('fact', lambda: calls.append(1) or '')
+
+    assert len(calls) == 1
+
+
+def test_failure_is_not_remembered():
+    store = factstore.FactStore()
+
+    def broken():
+        raise OSError('no such file')
+
+    with pytest.raises(OSError):
+        store.get('fact', broken)
+    assert store.get('fact', lambda: 'value') == 'value'
+
+
+def test_forget_computes_again():
+    store = factstore.FactStore()
+    store.get('fact', lambda: 'old')
+    store.forget('fact')
+
+    assert store.get('fact', lambda: 'new') == 'new'
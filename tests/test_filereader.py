@@ -0,0 +1,51 @@
+import os
+
+import filereader
+
+
+def make_root(tmp_path):
+    root = tmp_path / 'root'
+    (root / 'etc').mkdir(parents=True)
+    (root / 'usr' / 'lib').mkdir(parents=True)
+    (root / 'usr' / 'lib' / 'os-release').write_text('ID=inside\n')
+    (tmp_path / 'outside').write_text('ID=outside\n')
+    return root
+
+
+def test_dot_dot_does_not_leave_the_root(tmp_path):
+    root = make_root(tmp_path)
+    files = filereader.FileReader(root=str(root))
+
+    assert files.path('/../../outside') == os.path.join(str(root), 'outside')
+    assert files.read('/../outside') == ''
+
+
+def test_absolute_link_is_followed_inside_the_root(tmp_path):
+    root = make_root(tmp_path)
+    os.symlink('/usr/lib/os-release', str(root / 'etc' / 'os-release'))
+    files = filereader.FileReader(root=str(root))
+
+    assert files.read('/etc/os-release') == 'ID=inside'
+
+
+def test_relative_link_does_not_leave_the_root(tmp_path):
+    root = make_root(tmp_path)
+    os.symlink('../../../outside', str(root / 'etc' / 'os-release'))
+    files = filereader.FileReader(root=str(root))
+
+    assert files.path('/etc/os-release') == os.path.join(str(root), 'outside')
+    assert files.read('/etc/os-release') == ''
+
+
+def test_link_loop_stops(tmp_path):
+    root = make_root(tmp_path)
+    os.symlink('/etc/b', str(root / 'etc' / 'a'))
+    os.symlink('/etc/a', str(root / 'etc' / 'b'))
+    files = filereader.FileReader(root=str(root))
+
+    assert files.read('/etc/a') == ''
+    assert not files.exists('/etc/a')
+
+
+def test_real_root_is_used_as_is():
+    assert filereader.FileReader().path('/etc/os-release') == '/etc/os-release'
@@ -0,0 +1,16 @@
+import json
+
+import pytest
+
+import benchmark
+
+with open(benchmark.BUDGETS_PATH, 'r', encoding='utf-8') as budgets_file:
+    BUDGETS = json.load(budgets_file)
+
+
+@pytest.mark.parametrize('name', benchmark.Fixture.get_list_of_fixtures())
+def test_default_run_stays_within_budget(name):
+    assert name in BUDGETS, 'no budget declared for {}'.format(name)
+    used = benchmark.Guard.count(benchmark.Fixture(name))
+    assert used['processes'] <= BUDGETS[name]['processes']
+    assert used['files'] <= BUDGETS[name]['files']
@@ -0,0 +1,34 @@
+import infofetch
+
+RE_COLOR = infofetch.RE_COLOR
+truncate = getattr(infofetch.InfoFetch, '_InfoFetch__truncate')
+
+
+def visible(line: str) -> str:
+    return RE_COLOR.sub('', line)
+
+
+def test_short_line_is_unchanged():
+    line = '\033[;31mOS: \033[mDebian'
+    assert truncate(line, 40) == line
+
+
+def test_long_line_is_cut_at_the_visible_width():
+    line = '\033[;31mOS: \033[mDebian GNU/Linux 12 (bookworm)'
+    result = truncate(line, 10)
+
+    assert visible(result) == 'OS: Debian'
+    assert result.endswith('\033[m')
+
+
+def test_colors_are_not_counted_or_broken():
+    line = '\033[;31mabc\033[;32mdef\033[mghi'
+    result = truncate(line, 5)
+
+    assert visible(result) == 'abcde'
+    assert '\033[;32m' in result
+    assert all(RE_COLOR.fullmatch(code) for code in RE_COLOR.findall(result))
+
+
+def test_line_of_exactly_the_width_is_unchanged():
+    assert truncate('abcde', 5) == 'abcde'